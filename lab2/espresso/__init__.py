@@ -1,4 +1,3 @@
-from .algorithm import espresso_minimize_for_output
-
-__all__ = ["espresso_minimize_for_output"]
+from .algorithm import espresso_minimize_for_output, encode_cube
 
+__all__ = ["espresso_minimize_for_output", "encode_cube"]
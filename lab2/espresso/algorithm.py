@@ -1,52 +1,101 @@
 from __future__ import annotations
-from typing import List, Set, Dict, Tuple
+from typing import List, Set, Tuple, Optional
+
+# A cube is bitpacked as (care, val): bit k of `care` is set where the cube
+# has a fixed literal, and the matching bit of `val` holds that literal.
+# Position 0 of the PCN string maps to the most significant bit, so minterm
+# strings encode to their integer index and sort the same way.
+Cube = Tuple[int, int]
+
+
+# PCN -> binary digit strings for the care and value words
+_CARE_DIGITS = str.maketrans("01-", "110")
+_VAL_DIGITS = str.maketrans("-", "0")
+
+
+def encode_cube(cube: str) -> Cube:
+    if not cube:
+        return 0, 0
+    # translate + int(..., 2) run in C, with no per-character branching
+    return int(cube.translate(_CARE_DIGITS), 2), int(cube.translate(_VAL_DIGITS), 2)
+
+
+def decode_cube(cube: Cube, width: int) -> str:
+    care, val = cube
+    out = []
+    for k in range(width - 1, -1, -1):
+        if not (care >> k) & 1:
+            out.append('-')
+        else:
+            out.append('1' if (val >> k) & 1 else '0')
+    return ''.join(out)
+
 
 # ---- Basic predicates on cubes/inputs ----
 
-def implicant_covers_input(cube: str, xb: str) -> bool:
-    return all(c == '-' or c == x for c, x in zip(cube, xb))
+def implicant_covers_input(cube: Cube, x: int) -> bool:
+    care, val = cube
+    return (care & (val ^ x)) == 0
 
 
-def implicant_covers_implicant(a: str, b: str) -> bool:
+def implicant_covers_implicant(a: Cube, b: Cube) -> bool:
     """Return True if implicant a absorbs implicant b (a >= b).
     That is, whenever a is '-' or equals b at each position.
     """
-    for ca, cb in zip(a, b):
-        if ca != '-' and ca != cb:
-            return False
-    return True
+    ca, va = a
+    cb, vb = b
+    return (ca & ~cb) == 0 and (ca & (va ^ vb)) == 0
 
 
 # ---- Tiny QMC-style prime implicant generator for minterms (no '-') ----
 
-def _merge_pair(a: str, b: str) -> Tuple[bool, str]:
-    diff = 0
-    out = []
-    for ca, cb in zip(a, b):
-        if ca == cb:
-            out.append(ca)
-        else:
-            # merge allowed only if both are fixed and different
-            if ca in '01' and cb in '01':
-                diff += 1
-                if diff > 1:
-                    return False, ''
-                out.append('-')
-            else:
-                return False, ''
-    return (diff == 1, ''.join(out))
-
+def _qmc_round(groups: List[List[Cube]]) -> Tuple[List[List[Cube]], Set[Cube]]:
+    """One QMC combining pass over popcount buckets.
 
-def _reduce_absorb(cubes: List[str]) -> List[str]:
-    uniq = sorted(set(cubes))
-    keep: List[str] = []
-    for i, c in enumerate(uniq):
-        if not any(i != j and implicant_covers_implicant(uniq[j], c) for j in range(len(uniq))):
+    Two cubes merge iff they share `care` and their values differ in exactly
+    one bit, so the partners of a cube in bucket k are found by flipping each
+    of its fixed zeros and probing bucket k+1 instead of scanning all pairs.
+    Returns the merged cubes (bucketed by popcount) and the cubes that merged.
+    """
+    next_groups: List[List[Cube]] = [[] for _ in groups]
+    used: Set[Cube] = set()
+    for k in range(len(groups) - 1):
+        upper = set(groups[k + 1])
+        if not upper:
+            continue
+        out = next_groups[k]
+        seen: Set[Cube] = set()
+        for a in groups[k]:
+            ca, va = a
+            zeros = ca & ~va
+            while zeros:
+                d = zeros & -zeros
+                zeros ^= d
+                b = (ca, va | d)
+                if b in upper:
+                    used.add(a)
+                    used.add(b)
+                    # the dropped bit is 0 in a, so merged keeps a's popcount k
+                    merged = (ca & ~d, va)
+                    if merged not in seen:
+                        seen.add(merged)
+                        out.append(merged)
+    return next_groups, used
+
+
+def _reduce_absorb(cubes: List[Cube]) -> List[Cube]:
+    # A distinct cube can only be absorbed by one with strictly fewer fixed
+    # literals, and absorption is transitive, so sweeping in order of
+    # increasing literal count only needs to test the cubes already kept.
+    uniq = sorted(dict.fromkeys(cubes), key=lambda c: c[0].bit_count())
+    keep: List[Cube] = []
+    for c in uniq:
+        if not any(implicant_covers_implicant(k, c) for k in keep):
             keep.append(c)
     return keep
 
 
-def derive_prime_implicants(minterms: List[str]) -> List[str]:
+def derive_prime_implicants(minterms: List[Cube]) -> List[Cube]:
     """Generate a set of prime implicants from plain minterms (no '-').
 
     This is a lightweight Quine–McCluskey style combiner sufficient for the
@@ -55,173 +104,253 @@ def derive_prime_implicants(minterms: List[str]) -> List[str]:
     if not minterms:
         return []
 
-    groups: Dict[int, Set[str]] = {}
-    for m in set(minterms):
-        groups.setdefault(m.count('1'), set()).add(m)
+    # groups[k] holds the cubes with k ones; popcount is taken once per cube
+    uniq = set(minterms)
+    groups: List[List[Cube]] = [[] for _ in range(max(m[1].bit_count() for m in uniq) + 1)]
+    for m in uniq:
+        groups[m[1].bit_count()].append(m)
 
-    used: Set[str] = set()
-    primes: Set[str] = set()
+    primes: Set[Cube] = set()
     while groups:
-        keys = sorted(groups.keys())
-        next_groups: Dict[int, Set[str]] = {}
-        merged_any = False
-        used.clear()
-        for k in keys:
-            g1 = groups.get(k, set())
-            g2 = groups.get(k + 1, set())
-            for a in g1:
-                merged_here = False
-                for b in g2:
-                    ok, merged = _merge_pair(a, b)
-                    if ok:
-                        merged_here = True
-                        merged_any = True
-                        used.add(a)
-                        used.add(b)
-                        next_groups.setdefault(merged.count('1'), set()).add(merged)
-                if not merged_here and a not in used:
-                    primes.add(a)
+        next_groups, used = _qmc_round(groups)
         # add any untouched implicants
-        for k in keys:
-            for a in groups.get(k, set()):
+        for g in groups:
+            for a in g:
                 if a not in used:
                     primes.add(a)
-        groups = next_groups if merged_any else {}
+        groups = next_groups if used else []
 
     return _reduce_absorb(list(primes))
 
 
 # ---- Espresso REI primitives ----
 
-def build_off_cover(inputs_bits: List[str], onset_bits: Set[str], dcare_bits: Set[str]) -> List[str]:
+def build_off_cover(inputs: List[Cube], onset: Set[Cube], dcare: Set[Cube]) -> List[Cube]:
     """Prime implicants of the OFF-set, used to constrain expansion."""
-    off_bits = list(set(inputs_bits) - (onset_bits | dcare_bits))
-    if not off_bits:
+    off = list(set(inputs) - (onset | dcare))
+    if not off:
         return []
-    return derive_prime_implicants(off_bits)
+    return derive_prime_implicants(off)
+
 
+def blocking_matrix_rows(cube: Cube) -> List[Tuple[int, int]]:
+    """Rows = literals that could be raised during expansion.
 
-def blocking_matrix_rows(cube: str) -> List[Tuple[int, str]]:
-    """Rows = literals that could be raised during expansion."""
-    return [(i, b) for i, b in enumerate(cube) if b in '01']
+    Each row is (position mask, literal bit), ordered from the leftmost
+    position of the PCN string.
+    """
+    care, val = cube
+    rows: List[Tuple[int, int]] = []
+    while care:
+        m = 1 << (care.bit_length() - 1)
+        rows.append((m, val & m))
+        care ^= m
+    return rows
 
 
-def _blocking_cell_is_one(row: Tuple[int, str], off_cube: str) -> bool:
-    pos, pol = row
-    ob = off_cube[pos]
-    if ob == '-':
-        return False
-    return ob != pol
+def _literal_columns(cubes: List[Cube], width: int) -> List[Tuple[int, int]]:
+    """Transpose a cover into per-bit bitsets over cube indices.
 
+    Entry k is (cubes with a fixed 0 at bit k, cubes with a fixed 1 at bit k).
+    """
+    zeros = [0] * width
+    ones = [0] * width
+    for j, (care, val) in enumerate(cubes):
+        col = 1 << j
+        while care:
+            low = care & -care
+            care ^= low
+            if val & low:
+                ones[low.bit_length() - 1] |= col
+            else:
+                zeros[low.bit_length() - 1] |= col
+    return list(zip(zeros, ones))
 
-def _greedy_min_rows_cover(all_rows: List[Tuple[int, str]], off_cover: List[str]) -> Set[int]:
-    if not off_cover:
-        return set()
-    cols = list(range(len(off_cover)))
-    cover_map: Dict[int, Set[int]] = {}
-    for r_idx, row in enumerate(all_rows):
-        cover_map[r_idx] = {j for j, oc in enumerate(off_cover) if _blocking_cell_is_one(row, oc)}
-    uncovered = set(cols)
+
+def _greedy_set_cover(colsets: List[int], uncovered: int) -> Set[int]:
+    """Greedy set cover: repeatedly pick the row covering most columns.
+
+    Rows and the uncovered columns are bitsets; ties go to the first row.
+    """
     picked: Set[int] = set()
     while uncovered:
         best, gain = None, 0
-        for r_idx, colset in cover_map.items():
+        for r_idx, colset in enumerate(colsets):
             if r_idx in picked:
                 continue
-            g = len(colset & uncovered)
+            g = (colset & uncovered).bit_count()
             if g > gain:
                 best, gain = r_idx, g
         if best is None:
             # fallback: pick any remaining row if stuck
-            remaining = [r for r in range(len(all_rows)) if r not in picked]
+            remaining = [r for r in range(len(colsets)) if r not in picked]
             if not remaining:
                 break
             best = remaining[0]
         picked.add(best)
-        uncovered -= cover_map.get(best, set())
+        uncovered &= ~colsets[best]
         if gain == 0 and not uncovered:
             break
     return picked
 
 
-def _apply_raises(cube: str, keep_positions: Set[int]) -> str:
-    out = list(cube)
-    for i, b in enumerate(out):
-        if b in '01' and i not in keep_positions:
-            out[i] = '-'
-    return ''.join(out)
+def _greedy_min_rows_cover(all_rows: List[Tuple[int, int]], off_cols: List[Tuple[int, int]], n_off: int) -> Set[int]:
+    if not n_off:
+        return set()
+    # Blocking matrix: row r is a bitset whose bit j marks column off_cover[j],
+    # i.e. the OFF cubes holding the opposite literal at the row's position
+    cover_map = [off_cols[m.bit_length() - 1][0 if pol else 1] for m, pol in all_rows]
+    return _greedy_set_cover(cover_map, (1 << n_off) - 1)
+
+
+def _apply_raises(cube: Cube, keep_mask: int) -> Cube:
+    care, val = cube
+    return care & keep_mask, val & keep_mask
 
 
-def expand_one_cube(cube: str, off_cover: List[str]) -> str:
+def _expand(cube: Cube, off_cols: List[Tuple[int, int]], n_off: int) -> Cube:
     rows = blocking_matrix_rows(cube)
-    if not rows or not off_cover:
-        return '-' * len(cube)
-    keep_row_ids = _greedy_min_rows_cover(rows, off_cover)
-    keep_positions = {rows[r][0] for r in keep_row_ids}
-    return _apply_raises(cube, keep_positions)
-
-
-def irredundant(cover: List[str], inputs_bits: List[str], on_indices: Set[int]) -> List[str]:
-    """Remove cubes whose ON coverage is contained in others."""
-    cov: Dict[str, Set[int]] = {c: set() for c in cover}
-    for c in cover:
-        for i in on_indices:
-            if implicant_covers_input(c, inputs_bits[i]):
-                cov[c].add(i)
-    keep: List[str] = []
-    for i, c in enumerate(cover):
-        others = set()
-        for j, d in enumerate(cover):
-            if i == j:
-                continue
-            others |= cov[d]
-        if not cov[c] <= others:
-            keep.append(c)
-    return keep
+    if not rows or not n_off:
+        return 0, 0
+    keep_row_ids = _greedy_min_rows_cover(rows, off_cols, n_off)
+    keep_mask = 0
+    for r in keep_row_ids:
+        keep_mask |= rows[r][0]
+    return _apply_raises(cube, keep_mask)
 
 
-def reduce_cover(cover: List[str], inputs_bits: List[str], on_indices: Set[int]) -> List[str]:
-    """Reduce(F,D): shrink cubes to what is required to keep uniquely
-    covered ON minterms covered by that cube. This operation never expands a
-    cube; it adds literals (replaces '-' with fixed bits) based on the
-    consensus of ON minterms that only this cube covers.
+def expand_cover(cover: List[Cube], off_cover: List[Cube]) -> List[Cube]:
+    """Expand every cube of cover against the same OFF cover.
+
+    The OFF cover is transposed into literal columns once and shared by
+    all cubes.
     """
-    if not cover:
-        return []
+    width = max((care.bit_length() for care, _ in cover + off_cover), default=0)
+    off_cols = _literal_columns(off_cover, width)
+    return [_expand(c, off_cols, len(off_cover)) for c in cover]
+
+
+def expand_one_cube(cube: Cube, off_cover: List[Cube]) -> Cube:
+    return expand_cover([cube], off_cover)[0]
+
+
+def _literal_rows(inputs: List[Cube], on_indices: Set[int]) -> Tuple[int, List[Tuple[int, int]]]:
+    """Bitsets over ON indices, built once per output.
+
+    Returns (all ON rows, lits) where lits[k] = (ON rows with a 0 at bit k,
+    ON rows with a 1 at bit k).
+    """
+    width = max((care.bit_length() for care, _ in inputs), default=0)
+    ones = [0] * width
+    on_mask = 0
+    for i in on_indices:
+        row = 1 << i
+        on_mask |= row
+        x = inputs[i][1]
+        while x:
+            low = x & -x
+            x ^= low
+            ones[low.bit_length() - 1] |= row
+    return on_mask, [(on_mask & ~o, o) for o in ones]
+
+
+def _coverage_matrix(cover: List[Cube], rows: Tuple[int, List[Tuple[int, int]]]) -> List[int]:
+    """Row k is the bitset of the ON indices covered by cover[k].
+
+    Each fixed literal of a cube selects the ON rows that agree with it,
+    so a cube's coverage is one AND per literal rather than a test per
+    ON minterm.
+    """
+    on_mask, lits = rows
+    cov: List[int] = []
+    for care, val in cover:
+        bits = on_mask
+        while care and bits:
+            low = care & -care
+            care ^= low
+            bits &= lits[low.bit_length() - 1][1 if val & low else 0]
+        cov.append(bits)
+    return cov
+
+
+def _covered_once(cov: List[int]) -> int:
+    """Bitset of the ON minterms covered by exactly one row of `cov`."""
+    once = more = 0
+    for bits in cov:
+        more |= once & bits
+        once = (once | bits) & ~more
+    return once
+
+
+def _irredundant(cover: List[Cube], cov: List[int]) -> Tuple[List[Cube], List[int]]:
+    once = _covered_once(cov)
+    covered = 0
+    rest: List[int] = []
+    keep_ids: Set[int] = set()
+    for k, bits in enumerate(cov):
+        if bits & once:
+            keep_ids.add(k)
+            covered |= bits
+        else:
+            rest.append(k)
+    wanted = 0
+    for k in rest:
+        wanted |= cov[k]
+    picked = _greedy_set_cover([cov[k] for k in rest], wanted & ~covered)
+    keep_ids.update(rest[r] for r in picked)
+    kept = sorted(keep_ids)
+    return [cover[k] for k in kept], [cov[k] for k in kept]
+
+
+def irredundant(cover: List[Cube], inputs: List[Cube], on_indices: Set[int]) -> List[Cube]:
+    """Remove cubes whose ON coverage is contained in others.
+
+    A cube is kept outright when it is the only cover of some ON minterm.
+    The other cubes are kept only as needed by a greedy cover of the ON
+    minterms those essential cubes leave uncovered.
+    """
+    return _irredundant(cover, _coverage_matrix(cover, _literal_rows(inputs, on_indices)))[0]
 
-    # Build coverage map: for each ON index -> which cubes cover it
-    covers_of_on: Dict[int, Set[int]] = {i: set() for i in on_indices}
-    for idx, c in enumerate(cover):
-        for i in on_indices:
-            if implicant_covers_input(c, inputs_bits[i]):
-                covers_of_on[i].add(idx)
-
-    reduced: List[str] = []
-    for idx, c in enumerate(cover):
-        # ON minterms uniquely covered by this cube
-        essential_ons = [i for i in on_indices if idx in covers_of_on[i] and len(covers_of_on[i]) == 1]
+
+def _reduce(cover: List[Cube], cov: List[int], inputs: List[Cube]) -> List[Cube]:
+    # ON minterms uniquely covered by their cube
+    once = _covered_once(cov)
+    reduced: List[Cube] = []
+    for c, bits in zip(cover, cov):
+        essential_ons = bits & once
         if not essential_ons:
             # nothing forces this cube yet; leave it as is (it may be dropped by Irredundant)
             reduced.append(c)
             continue
 
         # Meet (bitwise consensus) of the essential minterms
-        meet = list(inputs_bits[essential_ons[0]])
-        for i in essential_ons[1:]:
-            xb = inputs_bits[i]
-            for p in range(len(meet)):
-                if meet[p] != xb[p]:
-                    meet[p] = '-'
+        meet_care, meet_val = inputs[essential_ons.bit_length() - 1]
+        while essential_ons:
+            low = essential_ons & -essential_ons
+            essential_ons ^= low
+            diff = meet_val ^ inputs[low.bit_length() - 1][1]
+            meet_care &= ~diff
+            meet_val &= ~diff
         # Ensure we do not expand beyond the original cube: intersect with c
-        for p in range(len(meet)):
-            if c[p] in '01' and meet[p] == '-':
-                # keep original fixed literal if original was more specific
-                meet[p] = c[p]
-        reduced.append(''.join(meet))
+        # (keep original fixed literal if original was more specific)
+        care, val = c
+        raised = care & ~meet_care
+        reduced.append((meet_care | care, meet_val | (val & raised)))
 
     return reduced
 
 
+def reduce_cover(cover: List[Cube], inputs: List[Cube], on_indices: Set[int]) -> List[Cube]:
+    """Reduce(F,D): shrink cubes to what is required to keep uniquely
+    covered ON minterms covered by that cube. This operation never expands a
+    cube; it adds literals (replaces '-' with fixed bits) based on the
+    consensus of ON minterms that only this cube covers.
+    """
+    if not cover:
+        return []
+    return _reduce(cover, _coverage_matrix(cover, _literal_rows(inputs, on_indices)), inputs)
+
+
 # ---- Driver: Espresso REI loop (slide 19) ----
 
 def espresso_minimize_for_output(
@@ -230,43 +359,61 @@ def espresso_minimize_for_output(
     which_output: int,
     *,
     max_iters: int = 20,
+    inputs: Optional[List[Cube]] = None,
 ) -> List[str]:
     """Return minimized cover (list of PCN cubes) for output index.
 
     F is initialized from primes over ON∪DC and filtered against OFF.
     Then follows: Expand; Irredundant; repeat { cost=|F|; Reduce; Expand; Irredundant } until |F|<cost no longer holds.
     A final absorption pass acts as Make_Sparse.
+    Cubes are bitpacked internally and only decoded to strings on return.
+    Callers minimizing several outputs can pass `inputs` (the encoded
+    inputs_bits) so the encoding is shared across outputs.
     """
-    onset_bits: Set[str] = {x for x, y in zip(inputs_bits, outputs_trits) if y[which_output] == '1'}
-    dcare_bits: Set[str] = {x for x, y in zip(inputs_bits, outputs_trits) if y[which_output] == '-'}
-    on_indices: Set[int] = {i for i, (_, y) in enumerate(zip(inputs_bits, outputs_trits)) if y[which_output] == '1'}
+    width = len(inputs_bits[0]) if inputs_bits else 0
+    if inputs is None:
+        inputs = [encode_cube(x) for x in inputs_bits]
+
+    # Partition the rows into ON / DC in one scan of the output column
+    onset: Set[Cube] = set()
+    dcare: Set[Cube] = set()
+    on_indices: Set[int] = set()
+    for i, (x, y) in enumerate(zip(inputs, outputs_trits)):
+        t = y[which_output]
+        if t == '1':
+            onset.add(x)
+            on_indices.add(i)
+        elif t == '-':
+            dcare.add(x)
 
     # Start with ON-set cover as minterms (per pseudocode: F = ON-SET cover)
-    cover = sorted(onset_bits)
-    off_bits = set(inputs_bits) - (onset_bits | dcare_bits)
+    cover = sorted(onset)
+
+    off_cover = build_off_cover(inputs, onset, dcare)
+    # OFF cover transposed once per output; every Expand below reuses it
+    n_off = len(off_cover)
+    off_cols = _literal_columns(off_cover, width)
 
-    off_cover = build_off_cover(inputs_bits, onset_bits, dcare_bits)
+    # ON-row bitsets per literal, shared by every coverage computation below
+    rows = _literal_rows(inputs, on_indices)
 
     # First Expand + Irredundant (as in the pseudocode)
-    cover = [expand_one_cube(c, off_cover) for c in cover]
-    cover = irredundant(cover, inputs_bits, on_indices)
+    cover = [_expand(c, off_cols, n_off) for c in cover]
+    cover, cov = _irredundant(cover, _coverage_matrix(cover, rows))
 
-    # REI loop with cost = number of cubes
+    # REI loop with cost = number of cubes. The coverage rows Irredundant
+    # keeps describe exactly the cover Reduce sees next, so each iteration
+    # computes coverage only once (after Expand).
     iters = 0
     while iters < max_iters:
         iters += 1
         cost = len(cover)
-        cover = reduce_cover(cover, inputs_bits, on_indices)
-        cover = [expand_one_cube(c, off_cover) for c in cover]
-        cover = irredundant(cover, inputs_bits, on_indices)
+        cover = _reduce(cover, cov, inputs)
+        cover = [_expand(c, off_cols, n_off) for c in cover]
+        cover, cov = _irredundant(cover, _coverage_matrix(cover, rows))
         if len(cover) < cost:
             continue
         break
 
     # Make_Sparse: absorption and uniqueness
-    cleaned: List[str] = []
-    for i, c in enumerate(cover):
-        if not any(i != j and implicant_covers_implicant(cover[j], c) for j in range(len(cover))):
-            cleaned.append(c)
-    cover = sorted(set(cleaned))
-    return cover
+    return sorted(decode_cube(c, width) for c in _reduce_absorb(cover))
@@ -3,7 +3,8 @@ import os
 import sys
 from io import StringIO
 from contextlib import redirect_stdout
-from typing import List, Optional
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Tuple
 
 # Make Lab1 helpers importable (same I/O contract)
 _HERE = os.path.dirname(__file__)
@@ -20,7 +21,7 @@ from truth_table import (
 )
 from pla import build_full_pla
 
-from espresso import espresso_minimize_for_output
+from espresso import espresso_minimize_for_output, encode_cube
 
 
 def _safe_stem(path: str) -> str:
@@ -64,11 +65,32 @@ def _cubes_for_pla(selected_cubes: List[str], n_outputs: int, which_output: int)
     return rows
 
 
+# Per-process copy of the truth table, set once by the pool initializer so
+# that each task only ships the output index.
+_WORKER_TABLE: Tuple[List[str], List[str], List[Tuple[int, int]]] = ([], [], [])
+
+
+def _init_worker(inputs_bits: List[str], outputs_trits: List[str], inputs: List[Tuple[int, int]]) -> None:
+    global _WORKER_TABLE
+    _WORKER_TABLE = (inputs_bits, outputs_trits, inputs)
+
+
+def _minimize_one(k: int) -> List[str]:
+    inputs_bits, outputs_trits, inputs = _WORKER_TABLE
+    return espresso_minimize_for_output(
+        inputs_bits=inputs_bits,
+        outputs_trits=outputs_trits,
+        which_output=k,
+        inputs=inputs,
+    )
+
+
 def run_from_sum_file(
     path: str,
     n_inputs: int,
     input_names: Optional[List[str]] = None,
     use_markdown: bool = False,
+    workers: Optional[int] = None,
 ) -> str:
     spec = parse_sum_of_minterms_file(path)
     inputs_bits, outputs_trits, out_names = build_outputs_from_minterm_indices(n_inputs, spec)
@@ -86,13 +108,26 @@ def run_from_sum_file(
         _save_truth_table_markdown(inputs_bits, outputs_trits, input_names, output_names, md_path)
         print(f"[i] Markdown truth table saved to: {md_path}")
 
+    # Encode the input rows once; every output reuses them
+    inputs = [encode_cube(x) for x in inputs_bits]
+
+    # Outputs are minimized independently, so spread them over processes
+    # (workers=1 or a single output keeps everything in-process)
+    n_out = len(output_names)
+    if n_out > 1 and workers != 1:
+        with ProcessPoolExecutor(
+            max_workers=min(n_out, workers or os.cpu_count() or 1),
+            initializer=_init_worker,
+            initargs=(inputs_bits, outputs_trits, inputs),
+        ) as ex:
+            covers = list(ex.map(_minimize_one, range(n_out)))
+    else:
+        _init_worker(inputs_bits, outputs_trits, inputs)
+        covers = [_minimize_one(k) for k in range(n_out)]
+
     all_pla_rows: List[str] = []
     for k, out_name in enumerate(output_names):
-        es_cubes: List[str] = espresso_minimize_for_output(
-            inputs_bits=inputs_bits,
-            outputs_trits=outputs_trits,
-            which_output=k,
-        )
+        es_cubes: List[str] = covers[k]
 
         sop_terms = [_cube_to_sop_term(c, input_names) for c in es_cubes]
         sop_str = " + ".join(sop_terms) if sop_terms else "0"
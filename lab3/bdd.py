@@ -10,7 +10,11 @@ For production use with optimization, install and use the 'dd' package:
 """
 
 from __future__ import annotations
-from typing import Dict, Tuple, Set, List, Optional
+from typing import Dict, Tuple, Set, List, Optional, Union
+
+# Node ids below this bound are packed into a single int unique-table key
+_ID_BITS = 20
+_ID_LIMIT = 1 << _ID_BITS
 
 
 class BDDNode:
@@ -20,6 +24,8 @@ class BDDNode:
     Terminal nodes have var=-1 and represent constants 0 or 1.
     """
 
+    __slots__ = ('var', 'low', 'high', 'id')
+
     def __init__(self, var: int, low: Optional['BDDNode'], high: Optional['BDDNode'], node_id: int):
         self.var = var          # Variable index (-1 for terminals)
         self.low = low          # Low (else) child
@@ -53,14 +59,16 @@ class BDD:
         self.one = BDDNode(-1, None, None, 1)
 
         # Unique table: (var, low_id, high_id) -> BDDNode
-        # Ensures canonical representation
-        self.unique_table: Dict[Tuple[int, int, int], BDDNode] = {}
+        # Ensures canonical representation. The triple is packed into one
+        # int while ids fit in _ID_BITS, avoiding a tuple per lookup.
+        self.unique_table: Dict[Union[int, Tuple[int, int, int]], BDDNode] = {}
+
+        # All nodes for traversal, indexed by node id (ids are dense)
+        self.all_nodes: List[BDDNode] = [self.zero, self.one]
 
-        # All nodes for traversal
-        self.all_nodes: Dict[int, BDDNode] = {
-            0: self.zero,
-            1: self.one
-        }
+        # Build cache: packed truth-table segment -> BDDNode
+        # Identical cofactors are built once instead of re-walked
+        self._build_cache: Dict[int, BDDNode] = {}
 
     def make_node(self, var: int, low: BDDNode, high: BDDNode) -> BDDNode:
         """
@@ -74,15 +82,20 @@ class BDD:
             return low
 
         # Check unique table for existing node
-        key = (var, low.id, high.id)
-        if key in self.unique_table:
-            return self.unique_table[key]
+        low_id, high_id = low.id, high.id
+        if low_id < _ID_LIMIT and high_id < _ID_LIMIT:
+            key = (((var << _ID_BITS) | low_id) << _ID_BITS) | high_id
+        else:
+            key = (var, low_id, high_id)
+        node = self.unique_table.get(key)
+        if node is not None:
+            return node
 
         # Create new canonical node
         node = BDDNode(var, low, high, self.next_id)
         self.next_id += 1
         self.unique_table[key] = node
-        self.all_nodes[node.id] = node
+        self.all_nodes.append(node)
         return node
 
     def build_from_truth_table(self, truth_table: List[int], var_names: List[str]) -> BDDNode:
@@ -101,43 +114,51 @@ class BDD:
                 f"Truth table size {len(truth_table)} != 2^{self.num_vars}"
             )
 
-        return self._shannon_expand(truth_table, 0, len(truth_table), 0)
+        # Pack the table into one int: bit i holds truth_table[i]
+        tt = int("".join("1" if v == 1 else "0" for v in reversed(truth_table)), 2)
 
-    def _shannon_expand(
-        self,
-        truth_table: List[int],
-        start: int,
-        end: int,
-        var: int
-    ) -> BDDNode:
+        return self._shannon_expand(tt, len(truth_table), 0)
+
+    def _shannon_expand(self, tt: int, width: int, var: int) -> BDDNode:
         """
         Recursively build BDD using Shannon decomposition.
 
         Shannon expansion: f = var' * f_low + var * f_high
         where f_low is f with var=0 and f_high is f with var=1.
+
+        `tt` is the truth table of the current cofactor packed into an int
+        of `width` bits, so constant checks and halving are big-int ops.
         """
         # Base case: check if function is constant
-        values = truth_table[start:end]
-        if all(v == 0 for v in values):
+        if tt == 0:
             return self.zero
-        if all(v == 1 for v in values):
+        if tt == (1 << width) - 1:
             return self.one
 
         # Shouldn't happen if truth table is correct size
         if var >= self.num_vars:
-            return self.one if truth_table[start] == 1 else self.zero
+            return self.one if tt & 1 else self.zero
+
+        # A sentinel bit above the segment encodes its width (and so var),
+        # giving a unique int key without allocating a tuple per call
+        key = tt | (1 << width)
+        node = self._build_cache.get(key)
+        if node is not None:
+            return node
 
         # Shannon decomposition on current variable
-        mid = start + (end - start) // 2
+        half = width // 2
 
-        # f_low: function when var=0
-        f_low = self._shannon_expand(truth_table, start, mid, var + 1)
+        # f_low: function when var=0 (first half of the table = low bits)
+        f_low = self._shannon_expand(tt & ((1 << half) - 1), half, var + 1)
 
         # f_high: function when var=1
-        f_high = self._shannon_expand(truth_table, mid, end, var + 1)
+        f_high = self._shannon_expand(tt >> half, half, var + 1)
 
         # Create node (with reduction via make_node)
-        return self.make_node(var, f_low, f_high)
+        node = self.make_node(var, f_low, f_high)
+        self._build_cache[key] = node
+        return node
 
     def build_from_minterm_spec(
         self,
@@ -156,14 +177,20 @@ class BDD:
         Returns:
             Root BDD node (don't-cares treated as 0)
         """
-        # Convert to truth table (DC treated as 0 for canonical form)
-        truth_table = [
-            1 if i in on_set else 0
-            for i in range(2 ** n_inputs)
-        ]
+        size = 2 ** n_inputs
+        if size != 2 ** self.num_vars:
+            raise ValueError(
+                f"Truth table size {size} != 2^{self.num_vars}"
+            )
+
+        # Scatter the ON minterms straight into a packed truth table
+        # (DC treated as 0 for canonical form)
+        bits = bytearray((size + 7) // 8)
+        for i in on_set:
+            if 0 <= i < size:
+                bits[i >> 3] |= 1 << (i & 7)
 
-        var_names = [f"x{i}" for i in range(n_inputs)]
-        return self.build_from_truth_table(truth_table, var_names)
+        return self._shannon_expand(int.from_bytes(bits, "little"), size, 0)
 
     def get_node_count(self) -> int:
         """Get total number of nodes (including terminals)."""
@@ -171,7 +198,7 @@ class BDD:
 
     def get_non_terminal_count(self) -> int:
         """Get number of internal (non-terminal) nodes."""
-        return sum(1 for n in self.all_nodes.values() if not n.is_terminal())
+        return len(self.all_nodes) - 2
 
     def print_bdd(self, root: BDDNode, indent: int = 0):
         """Print BDD structure (for debugging)."""
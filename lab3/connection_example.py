@@ -78,8 +78,9 @@ netlist = Netlist(num_inputs=2, var_names=var_names)
 netlist.build_from_bdd(bdd, root, output_name="f")
 
 print("After post-order traversal:")
-for node_id in sorted(netlist.signal_map.keys()):
-    signal = netlist.signal_map[node_id]
+for node_id, signal in enumerate(netlist.signal_map):
+    if signal is None:
+        continue
     if node_id == 0:
         print(f"  Node 0 (Terminal 0) → '{signal}'")
     elif node_id == 1:
@@ -124,7 +125,7 @@ if not root.high.is_terminal():
 low_sig = netlist.signal_map[root.low.id]
 high_sig = netlist.signal_map[root.high.id]
 var_sig = var_names[root.var]
-out_sig = netlist.signal_map[root.id] if root.id in netlist.signal_map else "n_root"
+out_sig = netlist.signal_map[root.id] or "n_root"
 
 print(f"  4. Node {root.id} (x{root.var}) - ROOT:")
 print(f"     - Inputs come from children:")
@@ -27,30 +27,46 @@ ITE Table (index corresponds to truth table [f=1,g=1 | f=1,g=0 | f=0,g=1 | f=0,g
 
 from __future__ import annotations
 from typing import Tuple, Optional, List
-from enum import Enum
-
-
-class GateType(Enum):
-    """Standard logic gate types."""
-    BUFFER = "BUF"
-    NOT = "NOT"
-    AND = "AND"
-    OR = "OR"
-    NAND = "NAND"
-    NOR = "NOR"
-    XOR = "XOR"
-    XNOR = "XNOR"
-    MUX = "MUX"  # 2-to-1 multiplexer (will be decomposed)
+from enum import IntEnum
+
+
+class GateType(IntEnum):
+    """Standard logic gate types.
+
+    Integer-valued so gate types compare and index as plain ints; the cell
+    name used when printing is `label`.
+    """
+    BUFFER = 0
+    NOT = 1
+    AND = 2
+    OR = 3
+    NAND = 4
+    NOR = 5
+    XOR = 6
+    XNOR = 7
+    MUX = 8  # 2-to-1 multiplexer (will be decomposed)
     # Composite gates (need decomposition)
-    GT = "GT"        # f > g = f·ḡ (AND with inverted g)
-    LT = "LT"        # f < g = f̄·g (AND with inverted f)
-    GTE = "GTE"      # f ≥ g = f + ḡ (OR with inverted g)
-    LTE = "LTE"      # f ≤ g = f̄ + g (OR with inverted f)
+    GT = 9         # f > g = f·ḡ (AND with inverted g)
+    LT = 10        # f < g = f̄·g (AND with inverted f)
+    GTE = 11       # f ≥ g = f + ḡ (OR with inverted g)
+    LTE = 12       # f ≤ g = f̄ + g (OR with inverted f)
+
+    @property
+    def label(self) -> str:
+        """Cell name of this gate type, e.g. "BUF" for BUFFER."""
+        return _GATE_LABELS[self]
+
+
+# Cell names indexed by GateType
+_GATE_LABELS = ("BUF", "NOT", "AND", "OR", "NAND", "NOR", "XOR", "XNOR",
+                "MUX", "GT", "LT", "GTE", "LTE")
 
 
 class Gate:
     """Represents a logic gate in the netlist."""
 
+    __slots__ = ('gate_type', 'output', 'inputs', 'id')
+
     def __init__(self, gate_type: GateType, output: str, inputs: List[str], gate_id: int):
         """Initialize a gate.
 
@@ -67,12 +83,79 @@ class Gate:
 
     def __repr__(self) -> str:
         inputs_str = ", ".join(self.inputs)
-        return f"{self.output} = {self.gate_type.value}({inputs_str})"
+        return f"{self.output} = {self.gate_type.label}({inputs_str})"
+
+
+# Constant signal names shared with the netlist and Verilog emitter
+ZERO_SIGNAL = "1'b0"
+ONE_SIGNAL = "1'b1"
+
+# Operand states used to index the dispatch table
+_CONST0, _CONST1, _VAR = 0, 1, 2
+_CONST_STATES = {'0': _CONST0, '1': _CONST1}
+
+# ITE patterns in priority order, walked once to build the dispatch table:
+# (f, g, h, g == h, gate type, input operands) where None matches any state
+# and the operand indices refer to (f, g, h, 1'b0).
+_ITE_RULES = (
+    (_VAR, _VAR, _CONST0, None, GateType.AND, (0, 1)),       # 0001: f·g
+    (_VAR, _CONST0, _CONST0, None, GateType.AND, (0, 3)),    # 0000: ite(f, 0, 0)
+    (None, _CONST1, _CONST0, None, GateType.BUFFER, (0,)),   # 0011: f
+    (_VAR, _CONST0, _VAR, None, GateType.LT, (0, 2)),        # 0100: f̄·g
+    (None, _VAR, None, True, GateType.BUFFER, (1,)),         # 0101: g
+    (_VAR, _CONST1, _VAR, None, GateType.OR, (0, 2)),        # 0111: f+g
+    (None, _CONST1, _VAR, None, GateType.GTE, (0, 2)),       # 1011: f+ḡ
+    (None, _CONST0, _CONST1, None, GateType.NOT, (0,)),      # 1100: f̄
+    (_VAR, _VAR, _CONST1, None, GateType.LTE, (0, 1)),       # 1101: f̄+g
+)
+
+
+def _row(fs: int, gs: int, hs: int, same: bool) -> int:
+    """Pack operand states (2 bits each) and the g == h flag into a table row."""
+    return (fs << 5) | (gs << 3) | (hs << 1) | same
+
+
+def _build_lut():
+    """Resolve every (f, g, h, g == h) state combination to its first matching rule."""
+    lut = [None] * (1 << 7)
+    states = (_CONST0, _CONST1, _VAR)
+    for fs in states:
+        for gs in states:
+            for hs in states:
+                for same in (False, True):
+                    entry = (GateType.MUX, (0, 1, 2))
+                    for rf, rg, rh, rsame, gate_type, operands in _ITE_RULES:
+                        if ((rf is None or rf == fs) and (rg is None or rg == gs)
+                                and (rh is None or rh == hs) and (rsame is None or rsame == same)):
+                            entry = (gate_type, operands)
+                            break
+                    lut[_row(fs, gs, hs, same)] = entry
+    return tuple(lut)
+
+
+# Dispatch table indexed by _row(); unused rows (state 3) are None
+_LUT = _build_lut()
 
 
 class ITETable:
     """Complete ITE lookup table with all 16 Boolean functions."""
 
+    @staticmethod
+    def classify(f: str, g: str, h: str,
+                 f_is_const: bool, g_is_const: bool, h_is_const: bool) -> Tuple[GateType, Tuple[int, ...]]:
+        """Classify ITE(f, g, h) without building a gate.
+
+        The decision depends only on the operand states, so it is served
+        from the precomputed dispatch table.
+
+        Returns:
+            (gate type, input operands as indices into (f, g, h, 1'b0))
+        """
+        fs = _CONST_STATES.get(f, _VAR) if f_is_const else _VAR
+        gs = _CONST_STATES.get(g, _VAR) if g_is_const else _VAR
+        hs = _CONST_STATES.get(h, _VAR) if h_is_const else _VAR
+        return _LUT[_row(fs, gs, hs, g == h)]
+
     @staticmethod
     def create_gate_for_ite(f: str, g: str, h: str,
                            f_is_const: bool, g_is_const: bool, h_is_const: bool,
@@ -94,79 +177,13 @@ class ITETable:
         Returns:
             Gate object
         """
-        # Extract constant values
-        f_val = int(f) if f_is_const and f in ['0', '1'] else -1
-        g_val = int(g) if g_is_const and g in ['0', '1'] else -1
-        h_val = int(h) if h_is_const and h in ['0', '1'] else -1
-
-        # Pattern matching based on ITE table
-
-        # 0001: ITE(f, g, 0) = f AND g
-        if h_val == 0 and g_val == -1 and f_val == -1:
-            return Gate(GateType.AND, output, [f, g], gate_id)
-
-        # 0010: ITE(f, ḡ, 0) or ITE(f, 0, NOT(h)) = f > g = f·ḡ
-        # This is ITE(f, g, 0) where g might need inversion
-        # Handled as composite GT gate
-        if h_val == 0 and g_val == 0 and f_val == -1:
-            # ITE(f, 0, 0) = 0, but this shouldn't happen
-            return Gate(GateType.AND, output, [f, "1'b0"], gate_id)
-
-        # 0011: ITE(f, 1, 0) = f (BUFFER)
-        if g_val == 1 and h_val == 0:
-            return Gate(GateType.BUFFER, output, [f], gate_id)
-
-        # 0100: ITE(f, 0, g) = f̄·g = f < g
-        if g_val == 0 and h_val == -1 and f_val == -1:
-            return Gate(GateType.LT, output, [f, h], gate_id)
-
-        # 0101: ITE(f, g, g) = g (BUFFER)
-        if g == h and g_val == -1:
-            return Gate(GateType.BUFFER, output, [g], gate_id)
-
-        # 0110: XOR - need to detect this pattern
-        # ITE(f, ḡ, g) = f XOR g
-        # This is complex to detect, so we handle it in MUX decomposition
-
-        # 0111: ITE(f, 1, g) = f OR g
-        if g_val == 1 and h_val == -1 and f_val == -1:
-            return Gate(GateType.OR, output, [f, h], gate_id)
-
-        # 1000: NOR - ITE(f, 0, ḡ) where we need h to be inverted
-        # Difficult to detect, treat as composite
-
-        # 1010: ITE(g, 0, 1) = NOT(g)
-        if g_val == 0 and h_val == 1:
-            return Gate(GateType.NOT, output, [f], gate_id)
-
-        # 1011: ITE(f, 1, ḡ) = f ≥ g = f + ḡ
-        if g_val == 1 and h_val == -1:
-            return Gate(GateType.GTE, output, [f, h], gate_id)
-
-        # 1100: ITE(f, 0, 1) = NOT(f)
-        if g_val == 0 and h_val == 1:
-            return Gate(GateType.NOT, output, [f], gate_id)
-
-        # 1101: ITE(f, g, 1) = f̄ + g = f ≤ g
-        if h_val == 1 and g_val == -1 and f_val == -1:
-            return Gate(GateType.LTE, output, [f, g], gate_id)
-
-        # 1110: NAND - ITE(f, ḡ, 1)
-        # Can be detected if we track inversions
-
-        # Default: treat as MUX (will be decomposed)
-        return Gate(GateType.MUX, output, [f, g, h], gate_id)
+        gate_type, operands = ITETable.classify(f, g, h, f_is_const, g_is_const, h_is_const)
+        signals = (f, g, h, ZERO_SIGNAL)
+        return Gate(gate_type, output, [signals[i] for i in operands], gate_id)
 
 
 def print_ite_table():
     """Print the complete ITE table for reference."""
-    print("=" * 80)
-    print("Complete ITE Operator Table")
-    print("=" * 80)
-    print()
-    print(f"{'Index':<8} {'Name':<15} {'Expression':<15} {'ITE Form':<20}")
-    print("-" * 80)
-
     table = [
         ("0000", "0", "0", "ite(f, 0, 0)"),
         ("0001", "AND(f,g)", "f·g", "ite(f, g, 0)"),
@@ -186,47 +203,42 @@ def print_ite_table():
         ("1111", "1", "1", "ite(f, 1, 1)"),
     ]
 
-    for idx, name, expr, ite_form in table:
-        print(f"{idx:<8} {name:<15} {expr:<15} {ite_form:<20}")
-
-    print()
-    print("Note: Composite gates (f>g, f<g, f≥g, f≤g) are decomposed into")
-    print("      standard cells: NOT + AND for GT/LT, NOT + OR for GTE/LTE")
+    fmt = "{:<8} {:<15} {:<15} {:<20}"
+    lines = [
+        "=" * 80,
+        "Complete ITE Operator Table",
+        "=" * 80,
+        "",
+        fmt.format("Index", "Name", "Expression", "ITE Form"),
+        "-" * 80,
+    ]
+    lines += [fmt.format(*row) for row in table]
+    lines += [
+        "",
+        "Note: Composite gates (f>g, f<g, f≥g, f≤g) are decomposed into",
+        "      standard cells: NOT + AND for GT/LT, NOT + OR for GTE/LTE",
+    ]
+    print("\n".join(lines))
 
 
 def ite_to_gate_example():
     """Example usage of ITE table."""
-    print("\n" + "=" * 60)
-    print("ITE Table Examples")
-    print("=" * 60 + "\n")
-
-    # ITE(x, 1, 0) = x (BUFFER)
-    gate1 = ITETable.create_gate_for_ite("x", "1", "0", False, True, True, "out1", 1)
-    print(f"ITE(x, 1, 0): {gate1}  → BUFFER")
-
-    # ITE(x, 0, 1) = NOT(x)
-    gate2 = ITETable.create_gate_for_ite("x", "0", "1", False, True, True, "out2", 2)
-    print(f"ITE(x, 0, 1): {gate2}  → NOT")
-
-    # ITE(x, y, 0) = x AND y
-    gate3 = ITETable.create_gate_for_ite("x", "y", "0", False, False, True, "out3", 3)
-    print(f"ITE(x, y, 0): {gate3}  → AND")
-
-    # ITE(x, 1, y) = x OR y
-    gate4 = ITETable.create_gate_for_ite("x", "1", "y", False, True, False, "out4", 4)
-    print(f"ITE(x, 1, y): {gate4}  → OR")
-
-    # ITE(x, 0, y) = f < g = NOT(x) AND y
-    gate5 = ITETable.create_gate_for_ite("x", "0", "y", False, True, False, "out5", 5)
-    print(f"ITE(x, 0, y): {gate5}  → LT (NOT(x) AND y)")
-
-    # ITE(x, y, 1) = f ≤ g = NOT(x) OR y
-    gate6 = ITETable.create_gate_for_ite("x", "y", "1", False, False, True, "out6", 6)
-    print(f"ITE(x, y, 1): {gate6}  → LTE (NOT(x) OR y)")
+    examples = [
+        # (f, g, h, const flags, expected mapping)
+        ("x", "1", "0", (False, True, True), "BUFFER"),
+        ("x", "0", "1", (False, True, True), "NOT"),
+        ("x", "y", "0", (False, False, True), "AND"),
+        ("x", "1", "y", (False, True, False), "OR"),
+        ("x", "0", "y", (False, True, False), "LT (NOT(x) AND y)"),
+        ("x", "y", "1", (False, False, True), "LTE (NOT(x) OR y)"),
+        ("x", "y", "z", (False, False, False), "MUX (decomposed)"),
+    ]
 
-    # ITE(x, y, z) = MUX(x, y, z)
-    gate7 = ITETable.create_gate_for_ite("x", "y", "z", False, False, False, "out7", 7)
-    print(f"ITE(x, y, z): {gate7}  → MUX (decomposed)")
+    lines = ["\n" + "=" * 60, "ITE Table Examples", "=" * 60 + "\n"]
+    for i, (f, g, h, consts, mapping) in enumerate(examples, 1):
+        gate = ITETable.create_gate_for_ite(f, g, h, *consts, f"out{i}", i)
+        lines.append(f"ITE({f}, {g}, {h}): {gate}  → {mapping}")
+    print("\n".join(lines))
 
 
 if __name__ == "__main__":
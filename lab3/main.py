@@ -10,8 +10,10 @@ Usage:
 """
 
 from __future__ import annotations
+import logging
 import sys
 import os
+from itertools import compress
 
 # Add parent directory to path to import lab1 modules
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
@@ -27,6 +29,8 @@ from lab3.bdd import BDD, BDDNode
 from lab3.netlist import Netlist
 from lab3.verilog_gen import VerilogGenerator
 
+log = logging.getLogger(__name__)
+
 
 def _safe_stem(path: str) -> str:
     """Extract filename stem without extension."""
@@ -44,78 +48,91 @@ def run_bdd_synthesis(
 ) -> None:
     """Run complete BDD synthesis flow: parse → BDD → netlist → Verilog.
 
+    Progress is reported through the module logger at INFO level; the
+    truth table, BDD and netlist dumps are only produced when INFO is
+    enabled.
+
     Args:
         path: Path to specification file
         n_inputs: Number of input variables
         output_dir: Directory for output files
         input_names: Optional custom input names
     """
-    print("=" * 60)
-    print("LAB 3: BDD-based Netlist Generation")
-    print("=" * 60)
-    print()
+    verbose = log.isEnabledFor(logging.INFO)
+    stem = _safe_stem(path)
+
+    log.info("=" * 60)
+    log.info("LAB 3: BDD-based Netlist Generation")
+    log.info("=" * 60)
+    log.info("")
 
     # 1. Parse spec and build truth table
-    print("Step 1: Parsing specification file...")
+    log.info("Step 1: Parsing specification file...")
     spec = parse_sum_of_minterms_file(path)
     inputs_bits, outputs_trits, out_names = build_outputs_from_minterm_indices(n_inputs, spec)
 
     if input_names is None:
         input_names = [f"x{i}" for i in range(n_inputs)]
 
-    print(f"  Inputs: {n_inputs} variables: {', '.join(input_names)}")
-    print(f"  Outputs: {len(out_names)} functions: {', '.join(out_names)}")
-    print()
+    log.info("  Inputs: %d variables: %s", n_inputs, ", ".join(input_names))
+    log.info("  Outputs: %d functions: %s", len(out_names), ", ".join(out_names))
+    log.info("")
 
     # Print truth table
-    print("Truth Table:")
-    print_truth_table(inputs_bits, outputs_trits, input_names, out_names)
-    print()
+    if verbose:
+        log.info("Truth Table:")
+        print_truth_table(inputs_bits, outputs_trits, input_names, out_names)
+        log.info("")
 
     # Create output directory
     os.makedirs(output_dir, exist_ok=True)
 
+    # Slice the table into per-output columns once
+    columns = _output_columns(outputs_trits, len(out_names))
+
     # Process each output function
     for output_idx, output_name in enumerate(out_names):
-        print("-" * 60)
-        print(f"Processing output: {output_name}")
-        print("-" * 60)
+        log.info("-" * 60)
+        log.info("Processing output: %s", output_name)
+        log.info("-" * 60)
 
         # Extract ON-set and DC-set for this output
-        on_set, dc_set = _extract_sets_for_output(inputs_bits, outputs_trits, output_idx)
+        on_set, dc_set = _extract_sets_for_output(columns[output_idx])
 
-        print(f"  ON-set: {sorted(on_set)}")
-        print(f"  DC-set: {sorted(dc_set)}")
-        print()
+        if verbose:
+            log.info("  ON-set: %s", sorted(on_set))
+            log.info("  DC-set: %s", sorted(dc_set))
+            log.info("")
 
         # 2. Build BDD from truth table
-        print(f"Step 2: Building BDD for {output_name}...")
+        log.info("Step 2: Building BDD for %s...", output_name)
         bdd = BDD(num_vars=n_inputs)
         root = bdd.build_from_minterm_spec(n_inputs, on_set, dc_set)
 
-        print(f"  BDD nodes (total): {bdd.get_node_count()}")
-        print(f"  BDD nodes (non-terminal): {bdd.get_non_terminal_count()}")
-        print()
+        log.info("  BDD nodes (total): %d", bdd.get_node_count())
+        log.info("  BDD nodes (non-terminal): %d", bdd.get_non_terminal_count())
+        log.info("")
 
         # Optional: Print BDD structure (for small circuits)
-        if bdd.get_non_terminal_count() <= 10:
-            print("  BDD Structure:")
+        if verbose and bdd.get_non_terminal_count() <= 10:
+            log.info("  BDD Structure:")
             bdd.print_bdd(root, indent=2)
-            print()
+            log.info("")
 
         # 3. Generate netlist from BDD
-        print(f"Step 3: Generating gate-level netlist for {output_name}...")
+        log.info("Step 3: Generating gate-level netlist for %s...", output_name)
         netlist = Netlist(num_inputs=n_inputs, var_names=input_names)
         netlist.build_from_bdd(bdd, root, output_name=output_name)
 
-        netlist.print_netlist()
-        netlist.print_stats()
-        print()
+        if verbose:
+            netlist.print_netlist()
+            netlist.print_stats()
+            log.info("")
 
         # 4. Generate SystemVerilog
-        print(f"Step 4: Generating SystemVerilog for {output_name}...")
+        log.info("Step 4: Generating SystemVerilog for %s...", output_name)
 
-        module_name = f"{_safe_stem(path)}_{output_name}"
+        module_name = f"{stem}_{output_name}"
         sv_module_file = os.path.join(output_dir, f"{module_name}.sv")
         sv_golden_file = os.path.join(output_dir, f"golden_model.v")
         sv_tb_file = os.path.join(output_dir, f"{module_name}_tb.sv")
@@ -126,93 +143,82 @@ def run_bdd_synthesis(
         vgen.generate_module(sv_module_file)
 
         # Generate behavioral golden model
-        expected_outputs = _build_expected_outputs(inputs_bits, outputs_trits, output_idx)
+        expected_outputs = _build_expected_outputs(columns[output_idx])
         vgen.generate_golden_model(sv_golden_file, expected_outputs)
 
         # Generate co-simulation testbench (random stimulus)
         num_random_tests = 1000  # Number of random test vectors
         vgen.generate_testbench(sv_tb_file, num_random_tests)
 
-        print(f"  Netlist (DUT):   {sv_module_file}")
-        print(f"  Golden Model:    {sv_golden_file}")
-        print(f"  Testbench:       {sv_tb_file}")
-        print(f"  Random tests:    {num_random_tests} vectors")
-        print()
-
-    print("=" * 60)
-    print("Synthesis Complete!")
-    print(f"Output files in: {output_dir}/")
-    print("=" * 60)
-    print()
-    print("To simulate with a SystemVerilog simulator:")
-    print(f"  cd {output_dir}")
+        log.info("  Netlist (DUT):   %s", sv_module_file)
+        log.info("  Golden Model:    %s", sv_golden_file)
+        log.info("  Testbench:       %s", sv_tb_file)
+        log.info("  Random tests:    %d vectors", num_random_tests)
+        log.info("")
+
+    log.info("=" * 60)
+    log.info("Synthesis Complete!")
+    log.info("Output files in: %s/", output_dir)
+    log.info("=" * 60)
+    log.info("")
+    log.info("To simulate with a SystemVerilog simulator:")
+    log.info("  cd %s", output_dir)
     for output_name in out_names:
-        module_name = f"{_safe_stem(path)}_{output_name}"
-        print(f"  # For {output_name}:")
-        print(f"    iverilog -g2012 -o sim {module_name}.sv golden_model.v {module_name}_tb.sv")
-        print(f"    vvp sim")
-        print()
-    print("Note: Testbench uses random stimulus and co-simulation")
-    print("      DUT (netlist) vs Golden Model (behavioral)")
-    print()
-
-
-def _extract_sets_for_output(
-    inputs_bits: List[str],
-    outputs_trits: List[str],
-    output_idx: int
-) -> Tuple[Set[int], Set[int]]:
-    """Extract ON-set and DC-set for a specific output.
+        module_name = f"{stem}_{output_name}"
+        log.info("  # For %s:", output_name)
+        log.info("    iverilog -g2012 -o sim %s.sv golden_model.v %s_tb.sv", module_name, module_name)
+        log.info("    vvp sim")
+        log.info("")
+    log.info("Note: Testbench uses random stimulus and co-simulation")
+    log.info("      DUT (netlist) vs Golden Model (behavioral)")
+    log.info("")
+
+
+# Byte tables turning a trit column into 0/1 masks: ON marks '1', DC marks '-'
+_ON_MASK = bytes.maketrans(b"01-", b"\x00\x01\x00")
+_DC_MASK = bytes.maketrans(b"01-", b"\x00\x00\x01")
+
+
+def _output_columns(outputs_trits: List[str], n_outputs: int) -> List[bytes]:
+    """Split the truth table into one trit column per output.
 
     Args:
-        inputs_bits: List of input combinations (binary strings)
-        outputs_trits: List of output values (trit strings with '0', '1', '-')
-        output_idx: Index of the output to extract
+        outputs_trits: List of output values (trit strings of n_outputs chars)
+        n_outputs: Number of outputs
 
     Returns:
-        (on_set, dc_set) - sets of minterm indices
+        List of ASCII columns; column k holds output k for every row
     """
-    on_set = set()
-    dc_set = set()
+    table = "".join(outputs_trits).encode()
+    return [table[k::n_outputs] for k in range(n_outputs)]
+
 
-    for i, out_trit in enumerate(outputs_trits):
-        if output_idx < len(out_trit):
-            val = out_trit[output_idx]
-            if val == '1':
-                on_set.add(i)
-            elif val == '-':
-                dc_set.add(i)
+def _extract_sets_for_output(column: bytes) -> Tuple[Set[int], Set[int]]:
+    """Extract ON-set and DC-set for a specific output.
+
+    Args:
+        column: Trit column of the output (b'0', b'1', b'-') over all rows
 
+    Returns:
+        (on_set, dc_set) - sets of minterm indices
+    """
+    rows = range(len(column))
+    on_set = set(compress(rows, column.translate(_ON_MASK)))
+    dc_set = set(compress(rows, column.translate(_DC_MASK)))
     return on_set, dc_set
 
 
-def _build_expected_outputs(
-    inputs_bits: List[str],
-    outputs_trits: List[str],
-    output_idx: int
-) -> List[int]:
+def _build_expected_outputs(column: bytes) -> bytes:
     """Build expected output values for testbench.
 
     Args:
-        inputs_bits: List of input combinations
-        outputs_trits: List of output values
-        output_idx: Index of the output
+        column: Trit column of the output over all rows
 
     Returns:
-        List of expected values (0 or 1), DC treated as 0
+        One byte per row holding the expected value (0 or 1), DC treated
+        as 0; indexes like a list of ints at a byte per entry
     """
-    expected = []
-    for out_trit in outputs_trits:
-        if output_idx < len(out_trit):
-            val = out_trit[output_idx]
-            if val == '1':
-                expected.append(1)
-            else:
-                expected.append(0)  # '0' or '-' (DC)
-        else:
-            expected.append(0)
-
-    return expected
+    return column.translate(_ON_MASK)
 
 
 def print_usage():
@@ -241,7 +247,20 @@ def print_usage():
 
 
 def main():
-    """Main entry point."""
+    """Main entry point.
+
+    Verbosity follows the LOG_LEVEL environment variable (default INFO).
+    """
+    level_name = os.environ.get("LOG_LEVEL", "INFO").upper()
+    level = getattr(logging, level_name, None)
+    logging.basicConfig(
+        level=level if isinstance(level, int) else logging.INFO,
+        format="%(message)s",
+        stream=sys.stdout,
+    )
+    if not isinstance(level, int):
+        log.warning("Unknown LOG_LEVEL %r, using INFO", level_name)
+
     args = sys.argv[1:]
     if not args:
         print_usage()
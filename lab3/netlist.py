@@ -6,17 +6,18 @@ and applying ITE-to-gate mappings.
 """
 
 from __future__ import annotations
-from typing import Dict, List, Set
+from typing import Dict, List, Optional
+import io
 import sys
 import os
 
 # Handle both module import and direct execution
 try:
     from lab3.bdd import BDD, BDDNode
-    from lab3.ite_table import Gate, GateType, ITETable
+    from lab3.ite_table import Gate, GateType, ITETable, ZERO_SIGNAL, ONE_SIGNAL
 except ModuleNotFoundError:
     from bdd import BDD, BDDNode
-    from ite_table import Gate, GateType, ITETable
+    from ite_table import Gate, GateType, ITETable, ZERO_SIGNAL, ONE_SIGNAL
 
 
 class Netlist:
@@ -32,15 +33,17 @@ class Netlist:
         self.num_inputs = num_inputs
         self.var_names = var_names
         self.gates: List[Gate] = []
+        self._type_counts: List[int] = [0] * len(GateType)  # indexed by GateType
         self.next_gate_id = 0
         self.next_wire_id = 0
 
-        # Signal naming: node_id -> signal_name
-        self.signal_map: Dict[int, str] = {}
+        # Signal naming: node_id -> signal_name (None for unmapped ids)
+        self.signal_map: List[Optional[str]] = []
 
     def add_gate(self, gate: Gate):
         """Add a gate to the netlist."""
         self.gates.append(gate)
+        self._type_counts[gate.gate_type] += 1
 
     def get_wire_name(self) -> str:
         """Generate a new internal wire name."""
@@ -65,81 +68,102 @@ class Netlist:
             root: Root node of the BDD
             output_name: Name for the output signal
         """
-        # Initialize signal map for terminals and inputs
-        self.signal_map[0] = "1'b0"  # Terminal 0
-        self.signal_map[1] = "1'b1"  # Terminal 1
-
-        # Traverse BDD in post-order (bottom-up)
-        visited: Set[int] = set()
-        self._traverse_and_build(root, visited)
-
-        # Map output
-        if root.id in self.signal_map:
-            # If root maps to a signal, create buffer to output
-            root_signal = self.signal_map[root.id]
-            if root_signal not in ["1'b0", "1'b1"]:
-                gate = Gate(GateType.BUFFER, output_name, [root_signal], self.get_gate_id())
-                self.add_gate(gate)
-            else:
-                # Constant output
-                self.signal_map[root.id] = output_name
+        # Reserve one signal slot per BDD node up front; ids are dense and
+        # children are created before parents, so no id exceeds this
+        size = max(bdd.get_node_count(), root.id + 1)
+        if len(self.signal_map) < size:
+            self.signal_map.extend([None] * (size - len(self.signal_map)))
 
-    def _traverse_and_build(self, node: BDDNode, visited: Set[int]):
-        """Recursively traverse BDD and build gates.
+        # Initialize signal map for terminals and inputs
+        self.signal_map[0] = ZERO_SIGNAL  # Terminal 0
+        self.signal_map[1] = ONE_SIGNAL   # Terminal 1
 
-        Args:
-            node: Current BDD node
-            visited: Set of visited node IDs
-        """
-        if node.id in visited:
+        # Constant function: the output is the terminal itself, no gates
+        if root.id <= 1:
+            self.signal_map[root.id] = output_name
             return
 
-        visited.add(node.id)
+        # Traverse BDD in post-order (bottom-up); the root gate drives the
+        # output directly
+        visited = bytearray(size)
+        self._traverse_and_build(root, visited, output_name)
 
-        # Terminal nodes already mapped
-        if node.is_terminal():
-            return
+    def _traverse_and_build(self, root: BDDNode, visited: bytearray, output_name: str):
+        """Traverse BDD in post-order and build gates.
 
-        # Recursively process children
-        self._traverse_and_build(node.low, visited)
-        self._traverse_and_build(node.high, visited)
-
-        # Get signal names for children
-        low_signal = self.signal_map.get(node.low.id)
-        high_signal = self.signal_map.get(node.high.id)
-        var_signal = self.var_names[node.var]
-
-        # Create wire for this node's output
-        node_output = self.get_wire_name()
-        self.signal_map[node.id] = node_output
-
-        # Determine if operands are constants
-        low_is_const = low_signal in ["1'b0", "1'b1"]
-        high_is_const = high_signal in ["1'b0", "1'b1"]
-        var_is_const = False  # Variables are never constant
-
-        # Create gate: ITE(var, high, low)
-        gate = ITETable.create_gate_for_ite(
-            f=var_signal,
-            g=high_signal,
-            h=low_signal,
-            f_is_const=var_is_const,
-            g_is_const=high_is_const,
-            h_is_const=low_is_const,
-            output=node_output,
-            gate_id=self.get_gate_id()
-        )
-
-        self.add_gate(gate)
+        Uses an explicit stack so deep BDDs do not hit the recursion limit.
+        A node is pushed once to expand its children (low before high) and
+        once more, marked ready, to emit its gate after both are built.
+
+        Args:
+            root: Root BDD node
+            visited: Per-node-id visited flags, sized like signal_map
+            output_name: Signal driven by the root gate
+        """
+        # Hot-loop state bound to locals; counters are written back at the end
+        signal_map = self.signal_map
+        var_names = self.var_names
+        add_gate = self.add_gate
+        create_gate = ITETable.create_gate_for_ite
+        next_wire = self.next_wire_id
+        next_gate = self.next_gate_id
+
+        stack = [(root, False)]
+        pop, push = stack.pop, stack.append
+        while stack:
+            node, ready = pop()
+
+            if not ready:
+                if visited[node.id]:
+                    continue
+                visited[node.id] = 1
+
+                # Terminal nodes already mapped
+                if node.var == -1:
+                    continue
+
+                push((node, True))
+                push((node.high, False))
+                push((node.low, False))
+                continue
+
+            # Get signal names for children
+            low, high = node.low, node.high
+            low_signal = signal_map[low.id]
+            high_signal = signal_map[high.id]
+            var_signal = var_names[node.var]
+
+            # Create wire for this node's output; the root drives the output
+            if node is root:
+                node_output = output_name
+            else:
+                node_output = f"n{next_wire}"
+                next_wire += 1
+            signal_map[node.id] = node_output
+
+            # Create gate: ITE(var, high, low); variables are never constant
+            # and constant operands are the terminals, ids 0 and 1
+            add_gate(create_gate(var_signal, high_signal, low_signal,
+                                 False, high.id <= 1, low.id <= 1,
+                                 node_output, next_gate))
+            next_gate += 1
+
+        self.next_wire_id = next_wire
+        self.next_gate_id = next_gate
+
+    def to_string(self) -> str:
+        """Render the netlist listing printed by print_netlist."""
+        buf = io.StringIO()
+        buf.write("\n=== Gate-Level Netlist ===\n")
+        buf.write(f"Inputs: {', '.join(self.var_names)}\n")
+        buf.write(f"Gates: {len(self.gates)}\n\n")
+        for i, gate in enumerate(self.gates, 1):
+            buf.write(f"  {i}. {gate.output} = {gate.gate_type.label}({', '.join(gate.inputs)})\n")
+        return buf.getvalue()
 
     def print_netlist(self):
         """Print netlist in human-readable format."""
-        print("\n=== Gate-Level Netlist ===")
-        print(f"Inputs: {', '.join(self.var_names)}")
-        print(f"Gates: {len(self.gates)}\n")
-
-        for i, gate in enumerate(self.gates, 1):
-            print(f"  {i}. {gate}")
+        sys.stdout.write(self.to_string())
 
     def get_stats(self) -> Dict[str, int]:
         """Get netlist statistics.
@@ -147,19 +171,22 @@ class Netlist:
         Returns:
             Dictionary with gate type counts
         """
-        stats = {gate_type.value: 0 for gate_type in GateType}
-        for gate in self.gates:
-            stats[gate.gate_type.value] += 1
-        return stats
+        counts = self._type_counts
+        return {gate_type.label: counts[gate_type] for gate_type in GateType}
+
+    def stats_to_string(self) -> str:
+        """Render the statistics printed by print_stats."""
+        buf = io.StringIO()
+        buf.write("\n=== Netlist Statistics ===\n")
+        buf.write(f"Total gates: {len(self.gates)}\n")
+        for gate_type, count in sorted(self.get_stats().items()):
+            if count > 0:
+                buf.write(f"  {gate_type}: {count}\n")
+        return buf.getvalue()
 
     def print_stats(self):
         """Print netlist statistics."""
-        stats = self.get_stats()
-        print("\n=== Netlist Statistics ===")
-        print(f"Total gates: {len(self.gates)}")
-        for gate_type, count in sorted(stats.items()):
-            if count > 0:
-                print(f"  {gate_type}: {count}")
+        sys.stdout.write(self.stats_to_string())
 
 
 def example_netlist():
@@ -8,7 +8,7 @@ Generates:
 """
 
 from __future__ import annotations
-from typing import List, TextIO
+from typing import List, Sequence
 
 # Handle both module import and direct execution
 try:
@@ -18,10 +18,67 @@ except ModuleNotFoundError:
     from netlist import Netlist
     from ite_table import Gate, GateType
 
+# Constant operands are routed through the const_0/const_1 signals
+_CONST_MAP = {"1'b0": "const_0", "1'b1": "const_1"}
+
+# Bound once at import instead of resolved on the enum class per gate
+_MUX = GateType.MUX
+
+# Output file buffer size; netlists and golden models grow with the function
+_WRITE_BUFFER = 1 << 20
+
+# Expected output values (0/1 bytes) to ROM digits
+_ROM_DIGITS = bytes.maketrans(b"\x00\x01", b"01")
+
+# Widest golden-model ROM literal; Verilator's default literal limit
+_ROM_MAX_BITS = 1 << 16
+
+
+def _write_parts(filename: str, parts: List[str]):
+    """Write the joined output chunks to filename in a single buffered write."""
+    with open(filename, 'wb', buffering=_WRITE_BUFFER) as f:
+        f.write("".join(parts).encode())
+
 
 class VerilogGenerator:
     """Generates SystemVerilog code from netlist."""
 
+    # Bound str.format of the standard cell instance text per gate type.
+    # Positional fields: 0 gate index, 1 MUX counter (names the MUX helper
+    # wires), 2 output, 3.. inputs.
+    _GATE_FMT = {
+        GateType.BUFFER: "    buf g{0} ({2}, {3});\n".format,
+        GateType.NOT: "    not g{0} ({2}, {3});\n".format,
+        GateType.AND: "    and g{0} ({2}, {3}, {4});\n".format,
+        GateType.OR: "    or g{0} ({2}, {3}, {4});\n".format,
+        GateType.NAND: "    nand g{0} ({2}, {3}, {4});\n".format,
+        GateType.NOR: "    nor g{0} ({2}, {3}, {4});\n".format,
+        GateType.XOR: "    xor g{0} ({2}, {3}, {4});\n".format,
+        GateType.XNOR: "    xnor g{0} ({2}, {3}, {4});\n".format,
+        # GT: f > g = f·ḡ = AND(f, NOT(g))
+        GateType.GT: ("    wire gt{0}_not;\n"
+                      "    not g{0}_0 (gt{0}_not, {4});\n"
+                      "    and g{0}_1 ({2}, {3}, gt{0}_not);\n").format,
+        # LT: f < g = f̄·g = AND(NOT(f), g)
+        GateType.LT: ("    wire lt{0}_not;\n"
+                      "    not g{0}_0 (lt{0}_not, {3});\n"
+                      "    and g{0}_1 ({2}, lt{0}_not, {4});\n").format,
+        # GTE: f ≥ g = f + ḡ = OR(f, NOT(g))
+        GateType.GTE: ("    wire gte{0}_not;\n"
+                       "    not g{0}_0 (gte{0}_not, {4});\n"
+                       "    or g{0}_1 ({2}, {3}, gte{0}_not);\n").format,
+        # LTE: f ≤ g = f̄ + g = OR(NOT(f), g)
+        GateType.LTE: ("    wire lte{0}_not;\n"
+                       "    not g{0}_0 (lte{0}_not, {3});\n"
+                       "    or g{0}_1 ({2}, lte{0}_not, {4});\n").format,
+        # MUX: out = sel ? a : b = (sel & a) | (~sel & b)
+        GateType.MUX: ("    wire mux{1}_sel_n, mux{1}_and0, mux{1}_and1;\n"
+                       "    not g{0}_0 (mux{1}_sel_n, {3});\n"
+                       "    and g{0}_1 (mux{1}_and0, {3}, {4});\n"
+                       "    and g{0}_2 (mux{1}_and1, mux{1}_sel_n, {5});\n"
+                       "    or g{0}_3 ({2}, mux{1}_and0, mux{1}_and1);\n").format,
+    }
+
     def __init__(self, netlist: Netlist, module_name: str = "circuit", output_name: str = "out",
                  testbench_name: str = None):
         """Initialize generator.
@@ -43,232 +100,175 @@ class VerilogGenerator:
         Args:
             filename: Output .sv file path
         """
-        with open(filename, 'w') as f:
-            self._write_module_header(f)
-            self._write_wire_declarations(f)
-            self._write_gate_instances(f)
-            self._write_module_footer(f)
+        parts: List[str] = []
+        self._write_module_header(parts)
+        self._write_wire_declarations(parts)
+        self._write_gate_instances(parts)
+        self._write_module_footer(parts)
+
+        _write_parts(filename, parts)
 
         print(f"Generated SystemVerilog module: {filename}")
 
-    def _write_module_header(self, f: TextIO):
+    def _write_module_header(self, parts: List[str]):
         """Write module header with ports."""
-        f.write(f"// Generated SystemVerilog module from BDD netlist\n")
-        f.write(f"// Inputs: {', '.join(self.netlist.var_names)}\n")
-        f.write(f"// Gates: {len(self.netlist.gates)}\n\n")
+        parts.append(f"// Generated SystemVerilog module from BDD netlist\n")
+        parts.append(f"// Inputs: {', '.join(self.netlist.var_names)}\n")
+        parts.append(f"// Gates: {len(self.netlist.gates)}\n\n")
 
-        f.write(f"module {self.module_name} (\n")
+        parts.append(f"module {self.module_name} (\n")
 
         # Input ports
         for i, var in enumerate(self.netlist.var_names):
-            f.write(f"    input  logic {var},\n")
+            parts.append(f"    input  logic {var},\n")
 
         # Output port
-        f.write(f"    output logic {self.output_name}\n")
-        f.write(");\n\n")
+        parts.append(f"    output logic {self.output_name}\n")
+        parts.append(");\n\n")
 
-    def _write_wire_declarations(self, f: TextIO):
+    def _write_wire_declarations(self, parts: List[str]):
         """Write internal wire declarations."""
-        # Collect all internal wires (n0, n1, n2, ...)
-        wires = set()
+        # Collect all internal wires (n0, n1, n2, ...); gates come in
+        # topological order, so insertion order is already n0, n1, n2, ...
+        # Constant inputs are noted in the same pass
+        wires = {}
+        has_const_0 = has_const_1 = False
         for gate in self.netlist.gates:
             # Output wire
-            if gate.output.startswith('n'):
-                wires.add(gate.output)
-            # Input wires (excluding primary inputs and constants)
+            if gate.output[:1] == 'n':
+                wires[gate.output] = None
+            # Input wires (excluding primary inputs) and constants
             for inp in gate.inputs:
-                if inp.startswith('n'):
-                    wires.add(inp)
+                if inp == "1'b0":
+                    has_const_0 = True
+                elif inp == "1'b1":
+                    has_const_1 = True
+                elif inp[:1] == 'n':
+                    wires[inp] = None
 
         if wires:
-            f.write("    // Internal wires\n")
-            for wire in sorted(wires):
-                f.write(f"    logic {wire};\n")
-            f.write("\n")
+            parts.append("    // Internal wires\n")
+            for wire in wires:
+                parts.append(f"    logic {wire};\n")
+            parts.append("\n")
 
         # Assign constants if used
-        has_const_0 = any("1'b0" in gate.inputs for gate in self.netlist.gates)
-        has_const_1 = any("1'b1" in gate.inputs for gate in self.netlist.gates)
-
         if has_const_0 or has_const_1:
-            f.write("    // Constants\n")
+            parts.append("    // Constants\n")
         if has_const_0:
-            f.write("    logic const_0 = 1'b0;\n")
+            parts.append("    logic const_0 = 1'b0;\n")
         if has_const_1:
-            f.write("    logic const_1 = 1'b1;\n")
+            parts.append("    logic const_1 = 1'b1;\n")
         if has_const_0 or has_const_1:
-            f.write("\n")
+            parts.append("\n")
 
-    def _write_gate_instances(self, f: TextIO):
+    def _write_gate_instances(self, parts: List[str]):
         """Write gate instances using standard cell primitives."""
-        f.write("    // Gate instances (standard cells)\n")
+        parts.append("    // Gate instances (standard cells)\n")
 
         self.mux_wire_counter = 0  # Counter for MUX decomposition wires
 
+        write_gate = self._write_gate_instance
         for i, gate in enumerate(self.netlist.gates):
-            self._write_gate_instance(f, gate, i)
+            write_gate(parts, gate, i)
 
-        f.write("\n")
+        parts.append("\n")
 
-    def _write_gate_instance(self, f: TextIO, gate: Gate, index: int):
+    def _write_gate_instance(self, parts: List[str], gate: Gate, index: int):
         """Write a single gate instance using standard cell primitives.
 
         Args:
-            f: File handle
+            parts: Output chunks, joined and written once by the caller
             gate: Gate to instantiate
             index: Gate index for unique naming
         """
         # Replace constants with signal names
-        inputs = []
-        for inp in gate.inputs:
-            if inp == "1'b0":
-                inputs.append("const_0")
-            elif inp == "1'b1":
-                inputs.append("const_1")
-            else:
-                inputs.append(inp)
-
-        # Use Verilog standard cell primitives
-        if gate.gate_type == GateType.BUFFER:
-            f.write(f"    buf g{index} ({gate.output}, {inputs[0]});\n")
-
-        elif gate.gate_type == GateType.NOT:
-            f.write(f"    not g{index} ({gate.output}, {inputs[0]});\n")
-
-        elif gate.gate_type == GateType.AND:
-            f.write(f"    and g{index} ({gate.output}, {inputs[0]}, {inputs[1]});\n")
-
-        elif gate.gate_type == GateType.OR:
-            f.write(f"    or g{index} ({gate.output}, {inputs[0]}, {inputs[1]});\n")
-
-        elif gate.gate_type == GateType.NAND:
-            f.write(f"    nand g{index} ({gate.output}, {inputs[0]}, {inputs[1]});\n")
-
-        elif gate.gate_type == GateType.NOR:
-            f.write(f"    nor g{index} ({gate.output}, {inputs[0]}, {inputs[1]});\n")
-
-        elif gate.gate_type == GateType.XOR:
-            f.write(f"    xor g{index} ({gate.output}, {inputs[0]}, {inputs[1]});\n")
-
-        elif gate.gate_type == GateType.XNOR:
-            f.write(f"    xnor g{index} ({gate.output}, {inputs[0]}, {inputs[1]});\n")
-
-        elif gate.gate_type == GateType.GT:
-            # GT: f > g = f·ḡ = AND(f, NOT(g))
-            # Decompose into: NOT + AND
-            not_wire = f"gt{index}_not"
-            f.write(f"    wire {not_wire};\n")
-            f.write(f"    not g{index}_0 ({not_wire}, {inputs[1]});\n")
-            f.write(f"    and g{index}_1 ({gate.output}, {inputs[0]}, {not_wire});\n")
-
-        elif gate.gate_type == GateType.LT:
-            # LT: f < g = f̄·g = AND(NOT(f), g)
-            # Decompose into: NOT + AND
-            not_wire = f"lt{index}_not"
-            f.write(f"    wire {not_wire};\n")
-            f.write(f"    not g{index}_0 ({not_wire}, {inputs[0]});\n")
-            f.write(f"    and g{index}_1 ({gate.output}, {not_wire}, {inputs[1]});\n")
-
-        elif gate.gate_type == GateType.GTE:
-            # GTE: f ≥ g = f + ḡ = OR(f, NOT(g))
-            # Decompose into: NOT + OR
-            not_wire = f"gte{index}_not"
-            f.write(f"    wire {not_wire};\n")
-            f.write(f"    not g{index}_0 ({not_wire}, {inputs[1]});\n")
-            f.write(f"    or g{index}_1 ({gate.output}, {inputs[0]}, {not_wire});\n")
-
-        elif gate.gate_type == GateType.LTE:
-            # LTE: f ≤ g = f̄ + g = OR(NOT(f), g)
-            # Decompose into: NOT + OR
-            not_wire = f"lte{index}_not"
-            f.write(f"    wire {not_wire};\n")
-            f.write(f"    not g{index}_0 ({not_wire}, {inputs[0]});\n")
-            f.write(f"    or g{index}_1 ({gate.output}, {not_wire}, {inputs[1]});\n")
-
-        elif gate.gate_type == GateType.MUX:
-            # Decompose MUX into standard cells
-            # MUX: out = sel ? a : b
-            # out = (sel & a) | (~sel & b)
-            sel, a, b = inputs[0], inputs[1], inputs[2]
-
-            # Generate intermediate wire names
-            sel_n = f"mux{self.mux_wire_counter}_sel_n"
-            sel_and_a = f"mux{self.mux_wire_counter}_and0"
-            sel_n_and_b = f"mux{self.mux_wire_counter}_and1"
-            self.mux_wire_counter += 1
-
-            # Declare intermediate wires
-            f.write(f"    wire {sel_n}, {sel_and_a}, {sel_n_and_b};\n")
+        inputs = [_CONST_MAP.get(inp, inp) for inp in gate.inputs]
 
-            # Decompose: out = (sel & a) | (~sel & b)
-            f.write(f"    not g{index}_0 ({sel_n}, {sel});\n")
-            f.write(f"    and g{index}_1 ({sel_and_a}, {sel}, {a});\n")
-            f.write(f"    and g{index}_2 ({sel_n_and_b}, {sel_n}, {b});\n")
-            f.write(f"    or g{index}_3 ({gate.output}, {sel_and_a}, {sel_n_and_b});\n")
+        parts.append(self._GATE_FMT[gate.gate_type](index, self.mux_wire_counter, gate.output, *inputs))
+        if gate.gate_type == _MUX:
+            self.mux_wire_counter += 1
 
-    def _write_module_footer(self, f: TextIO):
+    def _write_module_footer(self, parts: List[str]):
         """Write module footer."""
-        f.write("endmodule\n")
+        parts.append("endmodule\n")
 
-    def generate_golden_model(self, filename: str, truth_table: List[int]):
+    def generate_golden_model(self, filename: str, truth_table: Sequence[int]):
         """Generate behavioral golden model from truth table.
 
         Args:
             filename: Output .v file path for golden model
-            truth_table: Expected output for each input combination
+            truth_table: Expected output (0 or 1) for each input combination,
+                as a list of ints or one byte per entry
         """
-        with open(filename, 'w') as f:
-            self._write_golden_header(f)
-            self._write_golden_logic(f, truth_table)
-            self._write_golden_footer(f)
+        parts: List[str] = []
+        self._write_golden_header(parts)
+        self._write_golden_logic(parts, truth_table)
+        self._write_golden_footer(parts)
+
+        _write_parts(filename, parts)
 
         print(f"Generated golden model: {filename}")
 
-    def _write_golden_header(self, f: TextIO):
+    def _write_golden_header(self, parts: List[str]):
         """Write golden model header."""
-        f.write("// Behavioral golden model (reference implementation)\n")
-        f.write(f"// Auto-generated from truth table\n\n")
-        f.write("module ref_model (\n")
+        parts.append("// Behavioral golden model (reference implementation)\n")
+        parts.append(f"// Auto-generated from truth table\n\n")
+        parts.append("module ref_model (\n")
 
         # Input ports
         for i, var in enumerate(self.netlist.var_names):
-            f.write(f"    input  {var},\n")
+            parts.append(f"    input  {var},\n")
 
         # Output port
-        f.write(f"    output {self.output_name}\n")
-        f.write(");\n\n")
+        parts.append(f"    output {self.output_name}\n")
+        parts.append(");\n\n")
 
-    def _write_golden_logic(self, f: TextIO, truth_table: List[int]):
+    def _write_golden_logic(self, parts: List[str], truth_table: Sequence[int]):
         """Write behavioral logic using truth table.
 
-        Uses a case statement for clarity and direct mapping from truth table.
+        The truth table is stored as a ROM vector indexed by the input
+        concatenation, so the model grows by one bit per input combination
+        rather than one case line. Tables wider than _ROM_MAX_BITS fall back
+        to a case statement, since tools cap literal widths (Verilator
+        rejects literals over 64K bits by default).
         """
         num_inputs = self.netlist.num_inputs
+        size = 2 ** num_inputs
 
-        # Concatenate inputs for case statement
+        # Concatenate inputs to form the ROM address / case selector
         input_concat = "{" + ", ".join(self.netlist.var_names) + "}"
 
-        f.write("    // Behavioral implementation using truth table\n")
-        f.write(f"    reg {self.output_name}_reg;\n\n")
-        f.write("    always @(*) begin\n")
-        f.write(f"        case ({input_concat})\n")
+        parts.append("    // Behavioral implementation using truth table\n")
 
-        # Generate case for each input combination
-        for i in range(2 ** num_inputs):
-            pattern = format(i, f'0{num_inputs}b')
-            output_val = truth_table[i] if i < len(truth_table) else 0
+        if size > _ROM_MAX_BITS:
+            parts.append(f"    reg {self.output_name}_reg;\n\n")
+            parts.append("    always @(*) begin\n")
+            parts.append(f"        case ({input_concat})\n")
+
+            # Generate case for each input combination
+            for i in range(size):
+                pattern = format(i, f'0{num_inputs}b')
+                output_val = truth_table[i] if i < len(truth_table) else 0
+
+                # Format: 3'b000: out_reg = 1'b0;
+                parts.append(f"            {num_inputs}'b{pattern}: {self.output_name}_reg = 1'b{output_val};\n")
 
-            # Format: 3'b000: out_reg = 1'b0;
-            f.write(f"            {num_inputs}'b{pattern}: {self.output_name}_reg = 1'b{output_val};\n")
+            parts.append("            default: {}_reg = 1'bx;\n".format(self.output_name))
+            parts.append("        endcase\n")
+            parts.append("    end\n\n")
+            parts.append(f"    assign {self.output_name} = {self.output_name}_reg;\n\n")
+            return
 
-        f.write("            default: {}_reg = 1'bx;\n".format(self.output_name))
-        f.write("        endcase\n")
-        f.write("    end\n\n")
-        f.write(f"    assign {self.output_name} = {self.output_name}_reg;\n\n")
+        # Bit i of the ROM (MSB first, [0:size-1]) is the output for input i
+        rom_bits = bytes(truth_table[:size]).translate(_ROM_DIGITS).decode().ljust(size, "0")
 
-    def _write_golden_footer(self, f: TextIO):
+        parts.append(f"    localparam [0:{size - 1}] TRUTH_TABLE = {size}'b{rom_bits};\n\n")
+        parts.append(f"    assign {self.output_name} = TRUTH_TABLE[{input_concat}];\n\n")
+
+    def _write_golden_footer(self, parts: List[str]):
         """Write golden model footer."""
-        f.write("endmodule\n")
+        parts.append("endmodule\n")
 
     def generate_testbench(self, filename: str, num_random_tests: int = 1000):
         """Generate SystemVerilog testbench with random stimulus and co-simulation.
@@ -277,151 +277,153 @@ class VerilogGenerator:
             filename: Output testbench .sv file path
             num_random_tests: Number of random test vectors (default: 1000)
         """
-        with open(filename, 'w') as f:
-            self._write_tb_cosim_header(f)
-            self._write_tb_cosim_signals(f)
-            self._write_tb_cosim_instances(f)
-            self._write_tb_cosim_test(f, num_random_tests)
-            self._write_tb_cosim_footer(f)
+        parts: List[str] = []
+        self._write_tb_cosim_header(parts)
+        self._write_tb_cosim_signals(parts)
+        self._write_tb_cosim_instances(parts)
+        self._write_tb_cosim_test(parts, num_random_tests)
+        self._write_tb_cosim_footer(parts)
+
+        _write_parts(filename, parts)
 
         print(f"Generated co-simulation testbench: {filename}")
 
-    def _write_tb_cosim_header(self, f: TextIO):
+    def _write_tb_cosim_header(self, parts: List[str]):
         """Write co-simulation testbench header."""
-        f.write(f"// Co-simulation testbench for {self.module_name}\n")
-        f.write(f"// Compares gate-level netlist (DUT) against behavioral golden model\n")
-        f.write(f"// Uses random stimulus for verification\n\n")
-        f.write(f"module {self.testbench_name};\n\n")
+        parts.append(f"// Co-simulation testbench for {self.module_name}\n")
+        parts.append(f"// Compares gate-level netlist (DUT) against behavioral golden model\n")
+        parts.append(f"// Uses random stimulus for verification\n\n")
+        parts.append(f"module {self.testbench_name};\n\n")
 
-    def _write_tb_cosim_signals(self, f: TextIO):
+    def _write_tb_cosim_signals(self, parts: List[str]):
         """Write co-simulation testbench signals."""
-        f.write("    // Testbench signals\n")
+        parts.append("    // Testbench signals\n")
         for var in self.netlist.var_names:
-            f.write(f"    logic {var};\n")
-        f.write(f"\n")
-        f.write(f"    // DUT outputs\n")
-        f.write(f"    logic dut_{self.output_name};\n")
-        f.write(f"\n")
-        f.write(f"    // Golden model outputs\n")
-        f.write(f"    logic ref_{self.output_name};\n")
-        f.write(f"\n")
-        f.write("    int errors = 0;\n")
-        f.write("    int test_count = 0;\n\n")
-
-    def _write_tb_cosim_instances(self, f: TextIO):
+            parts.append(f"    logic {var};\n")
+        parts.append(f"\n")
+        parts.append(f"    // DUT outputs\n")
+        parts.append(f"    logic dut_{self.output_name};\n")
+        parts.append(f"\n")
+        parts.append(f"    // Golden model outputs\n")
+        parts.append(f"    logic ref_{self.output_name};\n")
+        parts.append(f"\n")
+        parts.append("    int errors = 0;\n")
+        parts.append("    int test_count = 0;\n\n")
+
+    def _write_tb_cosim_instances(self, parts: List[str]):
         """Write DUT and golden model instantiations."""
         # DUT (netlist) instantiation
-        f.write("    // DUT: Gate-level netlist\n")
-        f.write(f"    {self.module_name} dut (\n")
+        parts.append("    // DUT: Gate-level netlist\n")
+        parts.append(f"    {self.module_name} dut (\n")
         for var in self.netlist.var_names:
-            f.write(f"        .{var}({var}),\n")
-        f.write(f"        .{self.output_name}(dut_{self.output_name})\n")
-        f.write("    );\n\n")
+            parts.append(f"        .{var}({var}),\n")
+        parts.append(f"        .{self.output_name}(dut_{self.output_name})\n")
+        parts.append("    );\n\n")
 
         # Golden model instantiation
-        f.write("    // Golden Model: Behavioral reference\n")
-        f.write("    ref_model u_ref (\n")
+        parts.append("    // Golden Model: Behavioral reference\n")
+        parts.append("    ref_model u_ref (\n")
         for var in self.netlist.var_names:
-            f.write(f"        .{var}({var}),\n")
-        f.write(f"        .{self.output_name}(ref_{self.output_name})\n")
-        f.write("    );\n\n")
+            parts.append(f"        .{var}({var}),\n")
+        parts.append(f"        .{self.output_name}(ref_{self.output_name})\n")
+        parts.append("    );\n\n")
 
-    def _write_tb_cosim_test(self, f: TextIO, num_tests: int):
+    def _write_tb_cosim_test(self, parts: List[str], num_tests: int):
         """Write random stimulus test with co-simulation.
 
         Args:
-            f: File handle
+            parts: Output chunks, joined and written once by the caller
             num_tests: Number of random test vectors
         """
         num_inputs = self.netlist.num_inputs
 
-        f.write("    // Test stimulus with random inputs\n")
-        f.write("    initial begin\n")
-        f.write("        $display(\"=\" * 70);\n")
-        f.write("        $display(\"Co-Simulation Testbench\");\n")
-        f.write("        $display(\"DUT: Gate-level netlist\");\n")
-        f.write("        $display(\"REF: Behavioral golden model\");\n")
-        f.write("        $display(\"=\" * 70);\n")
-        f.write("        $display(\"\");\n\n")
+        parts.append("    // Test stimulus with random inputs\n")
+        parts.append("    initial begin\n")
+        parts.append("        $display(\"=\" * 70);\n")
+        parts.append("        $display(\"Co-Simulation Testbench\");\n")
+        parts.append("        $display(\"DUT: Gate-level netlist\");\n")
+        parts.append("        $display(\"REF: Behavioral golden model\");\n")
+        parts.append("        $display(\"=\" * 70);\n")
+        parts.append("        $display(\"\");\n\n")
 
         # Random seed
-        f.write("        // Initialize random seed\n")
-        f.write("        $display(\"Starting random verification with %0d test vectors...\", {});\n".format(num_tests))
-        f.write("        $display(\"\");\n\n")
+        parts.append("        // Initialize random seed\n")
+        parts.append("        $display(\"Starting random verification with %0d test vectors...\", {});\n".format(num_tests))
+        parts.append("        $display(\"\");\n\n")
 
         # Test loop
-        f.write(f"        repeat ({num_tests}) begin\n")
-        f.write("            // Generate random inputs\n")
+        parts.append(f"        repeat ({num_tests}) begin\n")
+        parts.append("            // Generate random inputs\n")
 
         for var in self.netlist.var_names:
-            f.write(f"            {var} = $random;\n")
+            parts.append(f"            {var} = $random;\n")
 
-        f.write("            #10;  // Wait for propagation\n\n")
+        parts.append("            #10;  // Wait for propagation\n\n")
 
-        f.write("            // Compare outputs\n")
-        f.write("            test_count++;\n")
-        f.write(f"            if (dut_{self.output_name} !== ref_{self.output_name}) begin\n")
-        f.write("                errors++;\n")
+        parts.append("            // Compare outputs\n")
+        parts.append("            test_count++;\n")
+        parts.append(f"            if (dut_{self.output_name} !== ref_{self.output_name}) begin\n")
+        parts.append("                errors++;\n")
 
         # Format error message
         input_display = "  ".join([f"%b" for _ in self.netlist.var_names])
-        f.write(f"                $display(\"ERROR [Test %0d]: Mismatch!\", test_count);\n")
-        f.write(f"                $display(\"  Inputs:  {input_display}\", {', '.join(self.netlist.var_names)});\n")
-        f.write(f"                $display(\"  DUT out: %b\", dut_{self.output_name});\n")
-        f.write(f"                $display(\"  REF out: %b\", ref_{self.output_name});\n")
-        f.write("                $display(\"\");\n")
-        f.write("            end\n")
+        parts.append(f"                $display(\"ERROR [Test %0d]: Mismatch!\", test_count);\n")
+        parts.append(f"                $display(\"  Inputs:  {input_display}\", {', '.join(self.netlist.var_names)});\n")
+        parts.append(f"                $display(\"  DUT out: %b\", dut_{self.output_name});\n")
+        parts.append(f"                $display(\"  REF out: %b\", ref_{self.output_name});\n")
+        parts.append("                $display(\"\");\n")
+        parts.append("            end\n")
 
         # Progress indicator (every 100 tests)
-        f.write("            if (test_count % 100 == 0)\n")
-        f.write("                $display(\"  Progress: %0d/%0d tests completed...\", test_count, {});\n".format(num_tests))
+        parts.append("            if (test_count % 100 == 0)\n")
+        parts.append("                $display(\"  Progress: %0d/%0d tests completed...\", test_count, {});\n".format(num_tests))
 
-        f.write("        end\n\n")
+        parts.append("        end\n\n")
 
         # Final report
-        f.write("        $display(\"\");\n")
-        f.write("        $display(\"=\" * 70);\n")
-        f.write("        $display(\"Test Summary\");\n")
-        f.write("        $display(\"=\" * 70);\n")
-        f.write("        $display(\"Total tests: %0d\", test_count);\n")
-        f.write("        $display(\"Passed:      %0d\", test_count - errors);\n")
-        f.write("        $display(\"Failed:      %0d\", errors);\n")
-        f.write("        $display(\"\");\n\n")
-
-        f.write("        if (errors == 0) begin\n")
-        f.write("            $display(\"*** VERIFICATION PASSED ***\");\n")
-        f.write("            $display(\"DUT matches golden model on all test vectors!\");\n")
-        f.write("        end else begin\n")
-        f.write("            $display(\"*** VERIFICATION FAILED ***\");\n")
-        f.write("            $display(\"%0d mismatches detected!\", errors);\n")
-        f.write("        end\n")
-        f.write("        $display(\"=\" * 70);\n\n")
-
-        f.write("        $finish;\n")
-        f.write("    end\n\n")
-
-    def _write_tb_cosim_footer(self, f: TextIO):
+        parts.append("        $display(\"\");\n")
+        parts.append("        $display(\"=\" * 70);\n")
+        parts.append("        $display(\"Test Summary\");\n")
+        parts.append("        $display(\"=\" * 70);\n")
+        parts.append("        $display(\"Total tests: %0d\", test_count);\n")
+        parts.append("        $display(\"Passed:      %0d\", test_count - errors);\n")
+        parts.append("        $display(\"Failed:      %0d\", errors);\n")
+        parts.append("        $display(\"\");\n\n")
+
+        parts.append("        if (errors == 0) begin\n")
+        parts.append("            $display(\"*** VERIFICATION PASSED ***\");\n")
+        parts.append("            $display(\"DUT matches golden model on all test vectors!\");\n")
+        parts.append("        end else begin\n")
+        parts.append("            $display(\"*** VERIFICATION FAILED ***\");\n")
+        parts.append("            $display(\"%0d mismatches detected!\", errors);\n")
+        parts.append("        end\n")
+        parts.append("        $display(\"=\" * 70);\n\n")
+
+        parts.append("        $finish;\n")
+        parts.append("    end\n\n")
+
+    def _write_tb_cosim_footer(self, parts: List[str]):
         """Write co-simulation testbench footer."""
-        f.write("endmodule\n")
+        parts.append("endmodule\n")
 
-    def _write_tb_test(self, f: TextIO, expected_outputs: List[int]):
+    def _write_tb_test(self, parts: List[str], expected_outputs: List[int]):
         """Write test stimulus and checking.
 
         Args:
-            f: File handle
+            parts: Output chunks, joined and written once by the caller
             expected_outputs: Expected output for each input combination
         """
-        f.write("    // Test stimulus\n")
-        f.write("    initial begin\n")
-        f.write("        $display(\"Starting exhaustive test...\");\n")
-        f.write(f"        $display(\"Testing {2 ** self.netlist.num_inputs} input combinations\");\n")
-        f.write("        $display(\"\");\n\n")
+        parts.append("    // Test stimulus\n")
+        parts.append("    initial begin\n")
+        parts.append("        $display(\"Starting exhaustive test...\");\n")
+        parts.append(f"        $display(\"Testing {2 ** self.netlist.num_inputs} input combinations\");\n")
+        parts.append("        $display(\"\");\n\n")
 
         # Header
         output_col_name = self.output_name if len(self.output_name) <= 3 else "out"
         header = f"        $display(\"  " + "  ".join(self.netlist.var_names) + f"  | {output_col_name} | exp | status\");\n"
-        f.write(header)
-        f.write("        $display(\"  " + "-" * (len(self.netlist.var_names) * 4 + 20) + "\");\n\n")
+        parts.append(header)
+        parts.append("        $display(\"  " + "-" * (len(self.netlist.var_names) * 4 + 20) + "\");\n\n")
 
         # Test each combination
         num_inputs = self.netlist.num_inputs
@@ -430,41 +432,41 @@ class VerilogGenerator:
             pattern = format(i, f'0{num_inputs}b')
 
             # Set inputs
-            f.write("        // Test case {}\n".format(i))
+            parts.append("        // Test case {}\n".format(i))
             for j, bit in enumerate(pattern):
-                f.write(f"        {self.netlist.var_names[j]} = 1'b{bit};\n")
+                parts.append(f"        {self.netlist.var_names[j]} = 1'b{bit};\n")
 
             # Expected output
             exp_out = expected_outputs[i] if i < len(expected_outputs) else 0
-            f.write(f"        expected = 1'b{exp_out};\n")
-            f.write("        #10;\n\n")
+            parts.append(f"        expected = 1'b{exp_out};\n")
+            parts.append("        #10;\n\n")
 
             # Check result
-            f.write(f"        if ({self.output_name} !== expected) begin\n")
-            f.write("            errors++;\n")
+            parts.append(f"        if ({self.output_name} !== expected) begin\n")
+            parts.append("            errors++;\n")
 
             # Format output display
             input_display = "  ".join([f"%b" for _ in range(num_inputs)])
-            f.write(f"            $display(\"  {input_display}  |  %b  |  %b  | FAIL\", " +
+            parts.append(f"            $display(\"  {input_display}  |  %b  |  %b  | FAIL\", " +
                    ", ".join(self.netlist.var_names) + f", {self.output_name}, expected);\n")
-            f.write("        end else begin\n")
-            f.write(f"            $display(\"  {input_display}  |  %b  |  %b  | PASS\", " +
+            parts.append("        end else begin\n")
+            parts.append(f"            $display(\"  {input_display}  |  %b  |  %b  | PASS\", " +
                    ", ".join(self.netlist.var_names) + f", {self.output_name}, expected);\n")
-            f.write("        end\n\n")
+            parts.append("        end\n\n")
 
         # Final report
-        f.write("        $display(\"\");\n")
-        f.write("        if (errors == 0)\n")
-        f.write("            $display(\"*** TEST PASSED: All test cases passed! ***\");\n")
-        f.write("        else\n")
-        f.write("            $display(\"*** TEST FAILED: %0d errors detected ***\", errors);\n\n")
+        parts.append("        $display(\"\");\n")
+        parts.append("        if (errors == 0)\n")
+        parts.append("            $display(\"*** TEST PASSED: All test cases passed! ***\");\n")
+        parts.append("        else\n")
+        parts.append("            $display(\"*** TEST FAILED: %0d errors detected ***\", errors);\n\n")
 
-        f.write("        $finish;\n")
-        f.write("    end\n\n")
+        parts.append("        $finish;\n")
+        parts.append("    end\n\n")
 
-    def _write_tb_footer(self, f: TextIO):
+    def _write_tb_footer(self, parts: List[str]):
         """Write testbench footer."""
-        f.write("endmodule\n")
+        parts.append("endmodule\n")
 
 
 def example_verilog():